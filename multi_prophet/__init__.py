@@ -1,31 +1,209 @@
+import os
+import numpy as np
+import pandas as pd
+from .aio import run_with_executor
 from .prophet import Prophet
+from .data_builder import DataFrameBuilder
 from .factories import model_pool_factory, dataframe_builder_factory
+from .diagnostics import (cv_key, cross_validation_plan, cutoff_forecast,
+                          cutoff_rows, combine_cutoff_forecasts)
+from .executors import executor_scope, is_process_executor, max_workers, run_tasks
+from .caching import LRUCache
+from .fingerprints import fingerprint, fit_config, fit_fingerprint
+from .instrumentation import Instrumentation, Profiled
+from .forecasts import combine_forecasts, trim_forecast, validate_layout
+from .persistence import save_pool, load_pool
+from .point_forecast import point_forecasts
+from .reports import FitReport, FitError, TuneReport
+from .scheduling import CostModel, Schedule, Timed, estimate_cost
+from .tasks import (fit_model, fit_changed_model, predict_model, fit_predict_model,
+                    cutoff_errors)
+from .tuning import (add_errors, candidates, prune_candidates, score, tuning_cutoffs,
+                     validate_metric)
+from .parquet import ParquetFrame, write_forecasts
+from .transport import frame_reference
 
 __version__ = "1.1.1"
 
+# values of prophet's cross_validation parallel argument and their backends
+PARALLEL_BACKENDS = {"threads": "thread", "processes": "process"}
+
+
+def __getattr__(name):
+    # forecaster imports prophet, which is slow to import
+    if name == "feature_cache":
+        from .forecaster import feature_cache
+
+        return feature_cache
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class MultiProphet:
-    def __init__(self, columns=[], config=None, regressors={}, **kwargs):
+    def __init__(self, columns=[], config=None, regressors={}, id_column=None,
+                 value_column="y", **kwargs):
         self.model_pool = model_pool_factory(columns=columns,
                                              config=config,
                                              regressors=regressors,
                                              **kwargs)
-        self.df_builder = dataframe_builder_factory(regressors)
+        self.df_builder = dataframe_builder_factory(regressors,
+                                                    id_column=id_column,
+                                                    value_column=value_column)
+        self.cost_model = CostModel()
+        self.last_schedule = None
+        self.instrumentation = None
+        self.prediction_cache = None
 
-    def fit(self, df, **kwargs):
-        for column, model in self.model_pool.items():
-            mdf = self._create_dataframe(df, column, train=True)
-            model.fit(mdf, **kwargs)
+    def fit(self, df, warm_start=False, force=False, slim=False, n_jobs=None,
+            executor=None, **kwargs):
+        columns = self.model_pool.keys()
+        source = self._frame_reference(df, None, columns, train=True)
+
+        def data_reference(executor, columns):
+            if is_process_executor(executor):
+                return self._frame_reference(df, executor, columns, train=True)
+            else:
+                return source
+
+        return self._fit(source, data_reference, columns,
+                         warm_start, force, slim, n_jobs, executor, kwargs)
+
+    def fit_from_parquet(self, path, columns=None, warm_start=False, force=False,
+                         slim=False, n_jobs=None, executor=None, **kwargs):
+        """Fits models on a Parquet file or dataset directory.
+
+        Each model only reads ds, its target and its cap, floor and regressor
+        columns, so the whole file is never loaded. Requires pyarrow.
+        """
+        data = ParquetFrame(path)
+        return self._fit(data,
+                         lambda executor, columns: data,
+                         self._columns(columns),
+                         warm_start, force, slim, n_jobs, executor, kwargs)
+
+    async def afit(self, df, max_concurrency=None, backend="thread", executor=None,
+                   **kwargs):
+        """Async fit, other keyword arguments are passed to fit.
+
+        Columns are fitted on executor, or on max_concurrency thread or process
+        workers created for the call. Cancelling stops fitting further columns,
+        columns already fitted keep their new models.
+        """
+        return await run_with_executor(self.fit, df,
+                                       max_concurrency=max_concurrency,
+                                       backend=backend,
+                                       executor=executor,
+                                       **kwargs)
+
+    def iter_fit_predict(self, df, future_df, warm_start=False, max_pending=None,
+                         n_jobs=None, executor=None, **kwargs):
+        """Fits every model and yields (column, forecast) as each one finishes.
+
+        With parallel workers forecasts are yielded in completion order and at
+        most max_pending columns (twice the number of workers by default) are
+        in flight, so memory is bounded by concurrency instead of the number of
+        columns. Columns that fail are raised as a FitError at the end.
+        """
+        report = FitReport()
+        columns = list(self.model_pool.keys())
+
+        with executor_scope(executor, n_jobs) as executor, \
+             self._frame_reference(df, executor, columns, train=True) as train_data, \
+             self._frame_reference(future_df, executor, columns) as future_data:
+            tasks = (
+                (column, (*self.model_pool[column].prepare_fit(warm_start),
+                          train_data.series(column),
+                          future_data.series(column),
+                          column,
+                          self.df_builder,
+                          kwargs))
+                for column in columns
+            )
+
+            if max_pending is None:
+                max_pending = 2 * (n_jobs if n_jobs and n_jobs > 0 else os.cpu_count())
+
+            results = self._run_tasks("fit_predict", fit_predict_model, tasks, executor,
+                                      max_pending)
+            for column, result, error in results:
+                if error is None:
+                    fitted, forecast = result
+                    model = self.model_pool[column]
+                    model.finish_fit(fitted, warm_start)
+                    report.add_fitted(column, model)
+                    self._invalidate_predictions([column])
+                    yield column, forecast
+                else:
+                    report.errors[column] = error
+
+        if report.errors:
+            raise FitError(report)
+
+    def instrument(self, callbacks=None):
+        """Records per-column timings of later fit, predict and cross validation.
+
+        Returns the Instrumentation that collects the events, set
+        instrumentation to None to stop recording.
+        """
+        self.instrumentation = Instrumentation(callbacks)
+        return self.instrumentation
+
+    def cache_predictions(self, maxsize=128, maxbytes=None):
+        """Caches full forecasts of later predict calls.
+
+        A forecast is reused while the model of its column and the frame built
+        for it from the future data frame are unchanged. Refitting or adding
+        components drops the entries of a column. Returns the LRUCache, set
+        prediction_cache to None to disable caching.
+        """
+        self.prediction_cache = LRUCache(maxsize=maxsize,
+                                         maxbytes=maxbytes,
+                                         sizeof=_frame_size)
+        return self.prediction_cache
+
+    def compact(self, columns=None):
+        return {
+            column: self.model_pool[column].compact()
+            for column in self._columns(columns)
+        }
 
     def make_future_dataframe(self, periods, **kwargs):
         model = self._first_model()
         return model.make_future_dataframe(periods, **kwargs)
 
-    def predict(self, future_df):
-        return {
-            column: model.predict(self._create_dataframe(future_df, column))
-            for column, model in self.model_pool.items()
-        }
+    def predict(self, future_df, columns=None, mode="full", output=None,
+                components=None, dtype=None, n_jobs=None, executor=None):
+        columns = self._columns(columns)
+        if output is None and self.df_builder.is_long(future_df):
+            output = "long"
+        if output is not None:
+            validate_layout(output)
+
+        if mode == "point":
+            forecasts = self._point_forecasts(future_df, columns)
+        elif mode == "full":
+            forecasts = self._forecasts(future_df, columns, output, components,
+                                        dtype, n_jobs, executor)
+        else:
+            raise ValueError(f"Unknown prediction mode {mode}, use full or point")
+
+        if output is None:
+            return forecasts
+        else:
+            return combine_forecasts(forecasts,
+                                     layout=output,
+                                     components=components or _components(mode),
+                                     dtype=dtype,
+                                     series_column=self.df_builder.id_column)
+
+    async def apredict(self, future_df, max_concurrency=None, backend="thread",
+                       executor=None, **kwargs):
+        """Async predict, other keyword arguments are passed to predict."""
+        return await run_with_executor(self.predict, future_df,
+                                       max_concurrency=max_concurrency,
+                                       backend=backend,
+                                       executor=executor,
+                                       **kwargs)
 
     def add_seasonality(self, columns=None, **kwargs):
         columns = self._columns(columns)
@@ -33,12 +211,16 @@ class MultiProphet:
         for model in self._models(columns):
             model.add_seasonality(**kwargs)
 
+        self._invalidate_predictions(columns)
+
     def add_country_holidays(self, country_name, columns=None):
         columns = self._columns(columns)
 
         for model in self._models(columns):
             model.add_country_holidays(country_name)
 
+        self._invalidate_predictions(columns)
+
     def add_regressor(self, name, columns=None, **kwargs):
         columns = self._columns(columns)
 
@@ -46,6 +228,7 @@ class MultiProphet:
             model.add_regressor(name, **kwargs)
 
         self._add_regressor_to_builder(name, columns)
+        self._invalidate_predictions(columns)
 
     def plot(self, forecasts, plotly=False, **kwargs):
         return {
@@ -61,26 +244,402 @@ class MultiProphet:
             for column, forecast in forecasts.items()
         }
 
-    def cross_validation(self, horizon, **kwargs):
+    def cross_validation(self, horizon, period=None, initial=None, cutoffs=None,
+                         n_jobs=None, executor=None, parallel=None, disable_tqdm=False,
+                         extra_output_columns=None):
+        """Cross validates every model, with each (column, cutoff) as a task.
+
+        parallel="threads" or "processes", as accepted by prophet, runs the
+        tasks on the thread or process backend. disable_tqdm is accepted for
+        compatibility, no progress bar is shown.
+        """
+        executor = _parallel_executor(parallel, executor)
+        key = cv_key(horizon, period, initial, cutoffs, extra_output_columns)
+        plans = {
+            column: cross_validation_plan(model.prophet, horizon, period, initial, cutoffs,
+                                          extra_output_columns)
+            for column, model in self.model_pool.items()
+            if key not in model.cv_cache
+        }
+
+        costs = {
+            (column, cutoff): estimate_cost(
+                cutoff_rows(self.model_pool[column].prophet, cutoff),
+                self.model_pool[column]
+            )
+            for column, plan in plans.items()
+            for cutoff in plan.cutoffs
+        }
+
+        forecasts = {}
+        with executor_scope(executor, n_jobs) as executor:
+            schedule = self._schedule(costs, executor)
+            tasks = (
+                ((column, cutoff), (self.model_pool[column].prophet,
+                                    cutoff,
+                                    plans[column].horizon,
+                                    plans[column].predict_columns))
+                for column, cutoff in schedule.order
+            )
+
+            for task, result, error in self._run_scheduled("cross_validation",
+                                                           cutoff_forecast, tasks,
+                                                           schedule, costs,
+                                                           executor):
+                if error is not None:
+                    raise error
+                forecasts[task], _ = result
+
+        for column, plan in plans.items():
+            self.model_pool[column].cv_cache[key] = combine_cutoff_forecasts(
+                [forecasts[column, cutoff] for cutoff in plan.cutoffs]
+            )
+
         return {
-            column: model.cross_validation(horizon=horizon, **kwargs)
+            column: model.cv_cache[key].copy()
             for column, model in self.model_pool.items()
         }
 
-    def performance_metrics(self, horizon, **kwargs):
+    async def across_validation(self, horizon, max_concurrency=None, backend="thread",
+                                executor=None, **kwargs):
+        """Async cross_validation, other keyword arguments are passed to it."""
+        return await run_with_executor(self.cross_validation, horizon,
+                                       max_concurrency=max_concurrency,
+                                       backend=backend,
+                                       executor=executor,
+                                       **kwargs)
+
+    def performance_metrics(self, horizon, cv_dfs=None, metrics=None,
+                            rolling_window=0.1, **kwargs):
+        if cv_dfs is None:
+            cv_dfs = self.cross_validation(horizon, **kwargs)
+
         return {
-            column: model.performance_metrics(horizon=horizon, **kwargs)
+            column: model.performance_metrics(horizon=horizon,
+                                              cv_df=cv_dfs[column],
+                                              metrics=metrics,
+                                              rolling_window=rolling_window)
             for column, model in self.model_pool.items()
         }
 
+    def tune(self, df, param_grid, horizon, metric="rmse", period=None, initial=None,
+             cutoffs=None, prune=0.5, refit=True, n_jobs=None, executor=None):
+        """Selects the best parameters of every column by cross validation.
+
+        param_grid is a dict of {parameter: values} or a list of parameter
+        dicts. Every (column, candidate, cutoff) fit runs on one shared
+        executor, cutoffs are evaluated in rounds starting with the latest,
+        and after every round candidates whose partial error is more than
+        prune worse than the best of their column are dropped. Each column is
+        then replaced by a model configured with its best parameters, which
+        is fitted on df if refit is set.
+        """
+        validate_metric(metric)
+        horizon = pd.Timedelta(horizon)
+        grid = candidates(param_grid)
+        report = TuneReport(metric)
+        source = self._frame_reference(df, None, self.model_pool.keys(), train=True)
+
+        column_cutoffs = {}
+        histories = {}
+        for column, model in self.model_pool.items():
+            mdf = source.create_df(self.df_builder, column, train=True)
+            history = mdf[mdf["y"].notna()]
+            column_cutoffs[column] = tuning_cutoffs(model, history, horizon,
+                                                    period, initial, cutoffs)[::-1]
+            histories[column] = history["ds"]
+
+        alive = {column: list(range(len(grid))) for column in self.model_pool.keys()}
+        errors = {column: {} for column in self.model_pool.keys()}
+        evaluated = {column: {} for column in self.model_pool.keys()}
+        pruned = {column: set() for column in self.model_pool.keys()}
+        failed = {column: {} for column in self.model_pool.keys()}
+        models = {
+            (column, index): model.configured(**params, uncertainty_samples=0)
+            for column, model in self.model_pool.items()
+            for index, params in enumerate(grid)
+        }
+
+        with executor_scope(executor, n_jobs) as executor, \
+             (self._frame_reference(df, executor, self.model_pool.keys(), train=True)
+              if is_process_executor(executor) else source) as data:
+            for step in range(max(map(len, column_cutoffs.values()), default=0)):
+                costs = {
+                    (column, index, column_cutoffs[column][step]): estimate_cost(
+                        int((histories[column] <= column_cutoffs[column][step]).sum()),
+                        models[column, index]
+                    )
+                    for column, indexes in alive.items()
+                    if step < len(column_cutoffs[column])
+                    for index in indexes
+                }
+
+                schedule = self._schedule(costs, executor)
+                tasks = (
+                    ((column, index, cutoff), (models[column, index].build(),
+                                               data.series(column),
+                                               column,
+                                               self.df_builder,
+                                               cutoff,
+                                               horizon))
+                    for column, index, cutoff in schedule.order
+                )
+
+                for task, result, error in self._run_scheduled("tune", cutoff_errors,
+                                                               tasks, schedule, costs,
+                                                               executor):
+                    column, index, _ = task
+                    if error is None:
+                        errors[column][index] = add_errors(errors[column].get(index),
+                                                           result[0])
+                        evaluated[column][index] = evaluated[column].get(index, 0) + 1
+                    else:
+                        failed[column][index] = error
+                        alive[column].remove(index)
+
+                for column, indexes in alive.items():
+                    scores = {i: score(errors[column][i], metric) for i in indexes}
+                    if prune is not None and scores:
+                        dropped = prune_candidates(scores, prune)
+                        pruned[column].update(dropped)
+                        alive[column] = [i for i in indexes if i not in dropped]
+
+            results = []
+            for column in self.model_pool.keys():
+                scores = {i: score(errors[column][i], metric) for i in alive[column]}
+                report.scores[column] = scores
+                if scores:
+                    best = min(scores, key=scores.__getitem__)
+                    report.best[column] = grid[best]
+                elif failed[column]:
+                    report.errors[column] = next(iter(failed[column].values()))
+
+                for index, params in enumerate(grid):
+                    results.append({
+                        "column": column,
+                        "params": params,
+                        metric: (score(errors[column][index], metric)
+                                 if index in errors[column] else np.nan),
+                        "cutoffs": evaluated[column].get(index, 0),
+                        "pruned": index in pruned[column],
+                        "failed": index in failed[column],
+                    })
+
+            report.results = pd.DataFrame(results)
+
+            for column, params in report.best.items():
+                self.model_pool[column] = self.model_pool[column].configured(**params)
+            self._invalidate_predictions(list(report.best.keys()))
+
+            if refit and report.best:
+                report.fit_report = self.fit(df, executor=executor)
+
+        if report.errors:
+            raise FitError(report)
+
+        return report
+
     def _init_model_pool(self, columns, **kwargs):
         return {c: Prophet(**kwargs) for c in columns}
 
     def _first_model(self):
         return list(self.model_pool.values())[0]
 
-    def _create_dataframe(self, df, column, train=False):
-        return self.df_builder.create_df(df, column, train=train)
+    def save(self, path):
+        save_pool(self.model_pool, self.df_builder, path)
+
+    @classmethod
+    def load(cls, path, lazy=True):
+        mp = cls()
+        mp.model_pool, mp.df_builder = load_pool(path, lazy=lazy)
+        return mp
+
+    def _fit(self, source, data_reference, columns, warm_start, force, slim, n_jobs,
+             executor, kwargs):
+        """Fits models whose data changed since their last fit.
+
+        Fingerprints are computed from the frames of source, data_reference
+        returns the reference handed to the tasks of the remaining columns.
+        Sources fingerprinted in tasks are only read by the tasks, which
+        return None instead of a model for unchanged columns.
+        """
+        report = FitReport()
+        in_tasks = getattr(source, "fingerprinted_in_tasks", False)
+        fingerprints = {}
+        costs = {}
+        for column in columns:
+            model = self.model_pool[column]
+            if in_tasks:
+                costs[column] = estimate_cost(source.num_rows, model)
+                continue
+
+            mdf = source.create_df(self.df_builder, column, train=True)
+            fingerprints[column] = fit_fingerprint(mdf, model, kwargs)
+            if force or model.fingerprint != fingerprints[column]:
+                costs[column] = estimate_cost(int(mdf["y"].count()), model)
+            else:
+                report.reused.append(column)
+
+        def task_args(column, data):
+            model = self.model_pool[column]
+            args = (*model.prepare_fit(warm_start), data.series(column), column,
+                    self.df_builder, kwargs)
+            if in_tasks:
+                args += (fit_config(model, kwargs), None if force else model.fingerprint)
+            return args
+
+        with executor_scope(executor, n_jobs) as executor, \
+             data_reference(executor, list(costs.keys())) as data:
+            schedule = self._schedule(costs, executor)
+            tasks = ((column, task_args(column, data)) for column in schedule.order)
+            func = fit_changed_model if in_tasks else fit_model
+
+            for column, result, error in self._run_scheduled("fit", func, tasks,
+                                                             schedule, costs,
+                                                             executor,
+                                                             _unchanged_fit):
+                if error is None:
+                    fitted, _ = result
+                    if in_tasks:
+                        fitted, fingerprints[column] = fitted
+                    if fitted is None:
+                        report.reused.append(column)
+                        continue
+
+                    model = self.model_pool[column]
+                    model.finish_fit(fitted, warm_start, fingerprints[column])
+                    report.add_fitted(column, model)
+                    self._invalidate_predictions([column])
+                    if slim:
+                        report.memory[column] = model.compact()
+                else:
+                    report.errors[column] = error
+
+        report.schedule = schedule
+        if report.errors:
+            raise FitError(report)
+
+        return report
+
+    def _schedule(self, costs, executor):
+        estimates = {
+            task: self.cost_model.estimate(_task_column(task), cost)
+            for task, cost in costs.items()
+        }
+        self.last_schedule = Schedule(estimates, max_workers(executor))
+        return self.last_schedule
+
+    def _run_scheduled(self, operation, func, tasks, schedule, costs, executor,
+                       skipped=None):
+        """Runs tasks in schedule order and learns from their runtimes.
+
+        Yields the same triples as run_tasks, with (result, seconds) results.
+        Runtimes of results for which skipped returns True are not learned.
+        """
+        schedule.start()
+        for task, result, error in self._run_tasks(operation, Timed(func), tasks,
+                                                   executor):
+            if error is None:
+                seconds = result[1]
+                schedule.runtimes[task] = seconds
+                if skipped is None or not skipped(result[0]):
+                    self.cost_model.learn(_task_column(task), costs[task], seconds)
+            yield task, result, error
+        schedule.finish()
+
+    def _run_tasks(self, operation, func, tasks, executor, max_pending=None):
+        """run_tasks that records the phases of every task when instrumented."""
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            yield from run_tasks(func, tasks, executor, max_pending)
+            return
+
+        for task, result, error in run_tasks(Profiled(func), tasks, executor,
+                                             max_pending):
+            if error is None:
+                result, profile = result
+                instrumentation.record(operation, task, profile)
+            yield task, result, error
+
+    def _forecasts(self, future_df, columns, output, components, dtype, n_jobs,
+                   executor):
+        forecasts, keys = self._cached_forecasts(future_df, columns)
+        missing = [column for column in columns if column not in forecasts]
+
+        if missing:
+            with executor_scope(executor, n_jobs) as executor, \
+                 self._frame_reference(future_df, executor, missing) as data:
+                tasks = (
+                    (column, (self.model_pool[column].prophet,
+                               data.series(column),
+                               column,
+                               self.df_builder))
+                    for column in missing
+                )
+
+                for column, forecast, error in self._run_tasks("predict",
+                                                               predict_model,
+                                                               tasks, executor):
+                    if error is not None:
+                        raise error
+                    if column in keys:
+                        self.prediction_cache.put(keys[column], forecast.copy())
+                    forecasts[column] = forecast
+
+        if output is not None:
+            # keep only the requested components of every forecast
+            forecasts = {
+                column: trim_forecast(forecast, components, dtype)
+                for column, forecast in forecasts.items()
+            }
+
+        return {column: forecasts[column] for column in columns}
+
+    def _cached_forecasts(self, future_df, columns):
+        """Returns cached forecasts and the cache keys of the missing columns.
+
+        Keys are (column, model version, fingerprint of the column's frame).
+        """
+        cache = self.prediction_cache
+        if cache is None:
+            return {}, {}
+
+        forecasts = {}
+        keys = {}
+        with self._frame_reference(future_df, None, columns) as data:
+            for column in columns:
+                key = (column,
+                       self.model_pool[column].version,
+                       fingerprint(data.create_df(self.df_builder, column)))
+                forecast = cache.get(key)
+                if forecast is None:
+                    keys[column] = key
+                else:
+                    forecasts[column] = forecast.copy()
+
+        return forecasts, keys
+
+    def _invalidate_predictions(self, columns):
+        if self.prediction_cache is not None:
+            columns = set(columns)
+            self.prediction_cache.evict(lambda key: key[0] in columns)
+
+    def _point_forecasts(self, future_df, columns):
+        with self._frame_reference(future_df, None, columns) as data:
+            dfs = {column: data.create_df(self.df_builder, column) for column in columns}
+
+        return point_forecasts(
+            {column: self.model_pool[column].prophet for column in columns},
+            dfs
+        )
+
+    def _frame_reference(self, df, executor, columns, train=False):
+        names = self.df_builder.input_columns(df, columns, train=train)
+        if self.df_builder.is_long(df):
+            return frame_reference(df, names, executor, self.df_builder.id_column)
+        else:
+            inputs = lambda column: self.df_builder.input_columns(df, [column], train)
+            return frame_reference(df, names, executor, inputs=inputs)
 
     def _contains_columns(self, df, column):
         return column in df.columns
@@ -96,3 +655,27 @@ class MultiProphet:
             return columns
         else:
             return self.model_pool.keys()
+
+
+def _frame_size(df):
+    return int(df.memory_usage(deep=True).sum())
+
+def _parallel_executor(parallel, executor):
+    if parallel is None or executor is not None:
+        return executor
+
+    if parallel not in PARALLEL_BACKENDS:
+        raise ValueError(f"parallel={parallel!r} is not supported, use one of "
+                         f"{', '.join(PARALLEL_BACKENDS)} or pass an executor")
+
+    return PARALLEL_BACKENDS[parallel]
+
+def _unchanged_fit(result):
+    # fit tasks that fingerprint their frame return no model when unchanged
+    return isinstance(result, tuple) and result[0] is None
+
+def _task_column(task):
+    return task[0] if isinstance(task, tuple) else task
+
+def _components(mode):
+    return ["yhat"] if mode == "point" else None
@@ -0,0 +1,52 @@
+import asyncio
+import functools
+import threading
+
+from .executors import cancellation, create_executor
+
+
+async def run_cancellable(func, *args, **kwargs):
+    """Runs func in a thread of the event loop without blocking it.
+
+    Cancelling the awaiting task stops func from starting further tasks
+    through run_tasks and makes it discard the results of running ones.
+    """
+    event = threading.Event()
+
+    def target():
+        with cancellation(event):
+            return func(*args, **kwargs)
+
+    loop = asyncio.get_running_loop()
+    try:
+        return await loop.run_in_executor(None, target)
+    except asyncio.CancelledError:
+        event.set()
+        raise
+
+async def run_with_executor(method, *args, max_concurrency=None, backend="thread",
+                            executor=None, **kwargs):
+    """Awaits method(*args, executor=..., **kwargs) with per-column work on executor.
+
+    Without an executor one is created for the call, with max_concurrency
+    thread or process workers.
+    """
+    owned = executor is None
+    if owned:
+        executor = create_executor(backend, max_concurrency)
+
+    try:
+        return await run_cancellable(functools.partial(method, executor=executor),
+                                     *args,
+                                     **kwargs)
+    finally:
+        if owned:
+            _shutdown(executor)
+
+def _shutdown(executor):
+    try:
+        executor.shutdown(wait=False, cancel_futures=True)
+    except TypeError:
+        # cancel_futures is new in Python 3.9 and optional for other backends,
+        # run_tasks cancels the futures it submitted once it is cancelled
+        executor.shutdown(wait=False)
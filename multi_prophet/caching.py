@@ -0,0 +1,97 @@
+import threading
+from collections import OrderedDict
+
+
+class LRUCache:
+    """Thread-safe mapping that evicts the least recently used entries.
+
+    Entries are evicted beyond maxsize entries, and with maxbytes beyond
+    that many bytes as measured by sizeof. Either limit can be None.
+    """
+
+    def __init__(self, maxsize=128, maxbytes=None, sizeof=None):
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._entries:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return self._entries[key]
+
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        size = self.sizeof(value) if self.sizeof is not None else 0
+
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = value
+            self._sizes[key] = size
+            self.bytes += size
+            self._evict()
+
+    def pop(self, key, default=None):
+        with self._lock:
+            if key not in self._entries:
+                return default
+
+            value = self._entries[key]
+            self._remove(key)
+            return value
+
+    def evict(self, predicate):
+        """Removes every entry whose key satisfies predicate."""
+        with self._lock:
+            for key in [k for k in self._entries if predicate(k)]:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def info(self):
+        info = {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+        if self.maxbytes is not None:
+            info.update(bytes=self.bytes, maxbytes=self.maxbytes)
+
+        return info
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _remove(self, key):
+        if key in self._entries:
+            del self._entries[key]
+            self.bytes -= self._sizes.pop(key)
+
+    def _evict(self):
+        while self._entries and self._over_limit():
+            self._remove(next(iter(self._entries)))
+
+    def _over_limit(self):
+        return (
+            (self.maxsize is not None and len(self._entries) > self.maxsize)
+            or (self.maxbytes is not None and self.bytes > self.maxbytes)
+        )
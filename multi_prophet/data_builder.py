@@ -1,33 +1,155 @@
+import numpy as np
 import pandas as pd
 
 TIME_COLUMN = "ds"
+VALUE_COLUMN = "y"
+LONG_COLUMNS = ["cap", "floor"]
+
+
+class ColumnArrays:
+    """Read-only arrays of input columns, shared by every per-column frame.
+
+    Each column is converted once, `ds` to datetimes, and later lookups
+    return the same array. Arrays are taken by position, skipping index
+    alignment.
+    """
+
+    def __init__(self, df):
+        self.df = df
+        self._arrays = {}
+
+    def __getitem__(self, column):
+        if column not in self._arrays:
+            self._arrays[column] = self._array(column)
+
+        return self._arrays[column]
+
+    def _array(self, column):
+        if column == TIME_COLUMN:
+            array = np.asarray(_datetimes(self.df[column]))
+        else:
+            array = self.df[column].to_numpy()
+
+        array = array.view()
+        array.flags.writeable = False
+        return array
+
+
+def _datetimes(values):
+    # to_datetime inspects every value of a datetime column before returning it
+    if pd.api.types.is_datetime64_dtype(values):
+        return values
+
+    return pd.to_datetime(values)
 
 
 class DataFrameBuilder:
-    def __init__(self, regressors):
+    """Builds the per-column frames that are passed to Prophet.
+
+    Wide input has a column per target, with cap_<column> and
+    floor_<column> limits. Long input has a row per date and series, the
+    series in id_column, the target in value_column and cap, floor and
+    regressors as plain columns.
+    """
+
+    def __init__(self, regressors, id_column=None, value_column=VALUE_COLUMN):
         self.regressors = regressors
+        self.id_column = id_column
+        self.value_column = value_column
+
+    def is_long(self, df):
+        return self.id_column is not None and self._contains_columns(df, self.id_column)
+
+    def create_df(self, df, column, train=False, arrays=None):
+        if arrays is None:
+            values = lambda c: df[c].values
+        else:
+            values = arrays.__getitem__
 
-    def create_df(self, df, column, train=False):
-        train_df = pd.DataFrame({"ds": df[TIME_COLUMN].values})
+        data = {"ds": values(TIME_COLUMN)}
 
         if train:
-            train_df["y"] = df[column].values
+            data["y"] = values(column)
 
         if self._contains_columns(df, f"cap_{column}"):
-            train_df["cap"] = df[f"cap_{column}"].values
+            data["cap"] = values(f"cap_{column}")
 
         if self._contains_columns(df, f"floor_{column}"):
-            train_df["floor"] = df[f"floor_{column}"].values
+            data["floor"] = values(f"floor_{column}")
+
+        for regressor in self.regressors.get(column, []):
+            data[regressor] = values(regressor)
+
+        if arrays is None:
+            return pd.DataFrame(data)
+        else:
+            return pd.DataFrame(data, copy=False)
+
+    def create_series_df(self, df, column, rows, train=False, arrays=None):
+        """Creates the frame of one series from the rows of a long frame."""
+        if arrays is None:
+            values = lambda c: df[c].values[rows]
+        else:
+            values = lambda c: arrays[c][rows]
+
+        data = {"ds": values(TIME_COLUMN)}
+
+        if train:
+            data["y"] = values(self.value_column)
+
+        for name in LONG_COLUMNS:
+            if self._contains_columns(df, name):
+                data[name] = values(name)
 
         for regressor in self.regressors.get(column, []):
-            train_df[regressor] = df[regressor]
+            data[regressor] = values(regressor)
+
+        return pd.DataFrame(data, copy=False)
 
-        return train_df
+    def create_dfs(self, df, columns, train=False):
+        """Yields (column, df) pairs whose frames share the input arrays.
+
+        The frames are read-only views, Prophet copies its inputs before
+        modifying them.
+        """
+        arrays = ColumnArrays(df)
+        for column in columns:
+            yield column, self.create_df(df, column, train=train, arrays=arrays)
+
+    def input_columns(self, df, columns, train=False):
+        if self.is_long(df):
+            return self._long_input_columns(df, columns, train)
+
+        names = [TIME_COLUMN]
+
+        for column in columns:
+            if train:
+                names.append(column)
+
+            names.extend(
+                c for c in [f"cap_{column}", f"floor_{column}"]
+                if self._contains_columns(df, c)
+            )
+            names.extend(self.regressors.get(column, []))
+
+        return list(dict.fromkeys(names))
 
     def add_regressor(self, name, columns):
         for column in columns:
             self._append_regressor(name, column)
 
+    def _long_input_columns(self, df, columns, train):
+        names = [TIME_COLUMN]
+
+        if train:
+            names.append(self.value_column)
+
+        names.extend(c for c in LONG_COLUMNS if self._contains_columns(df, c))
+        for column in columns:
+            names.extend(self.regressors.get(column, []))
+
+        return list(dict.fromkeys(names))
+
     def _contains_columns(self, df, column):
         return column in df.columns
 
@@ -0,0 +1,102 @@
+import logging
+from collections import namedtuple
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+CrossValidationPlan = namedtuple("CrossValidationPlan",
+                                 ["horizon", "predict_columns", "cutoffs"])
+
+
+# prophet.diagnostics imports prophet, so it is only imported when used
+def cross_validation(model, **kwargs):
+    from prophet.diagnostics import cross_validation
+
+    return cross_validation(model, **kwargs)
+
+def performance_metrics(df, **kwargs):
+    from prophet.diagnostics import performance_metrics
+
+    return performance_metrics(df, **kwargs)
+
+def cv_key(horizon, period=None, initial=None, cutoffs=None, extra_output_columns=None):
+    return (
+        pd.Timedelta(horizon),
+        _timedelta(period),
+        _timedelta(initial),
+        tuple(pd.Timestamp(c) for c in cutoffs) if cutoffs is not None else None,
+        tuple(_column_list(extra_output_columns))
+    )
+
+def cross_validation_plan(model, horizon, period=None, initial=None, cutoffs=None,
+                          extra_output_columns=None):
+    """Selects the cutoffs and columns exactly as prophet.diagnostics.cross_validation does."""
+    if model.history is None:
+        raise Exception("Model has not been fit. Fitting the model provides "
+                        "contextual parameters for cross validation.")
+
+    df = model.history
+    horizon = pd.Timedelta(horizon)
+
+    predict_columns = ["ds", "yhat"]
+    if model.uncertainty_samples:
+        predict_columns.extend(["yhat_lower", "yhat_upper"])
+    predict_columns.extend(c for c in _column_list(extra_output_columns)
+                           if c not in predict_columns)
+
+    period_max = max([s["period"] for s in model.seasonalities.values()], default=0.)
+    cutoffs = plan_cutoffs(df, horizon, period, initial, cutoffs, period_max)
+
+    return CrossValidationPlan(horizon, predict_columns, cutoffs)
+
+def plan_cutoffs(df, horizon, period=None, initial=None, cutoffs=None, period_max=0.):
+    """Cutoffs of a history df, period_max is its longest seasonality in days."""
+    horizon = pd.Timedelta(horizon)
+    seasonality_dt = pd.Timedelta(str(period_max) + " days")
+
+    if cutoffs is None:
+        from prophet.diagnostics import generate_cutoffs
+
+        period = 0.5 * horizon if period is None else pd.Timedelta(period)
+        initial = (
+            max(3 * horizon, seasonality_dt) if initial is None
+            else pd.Timedelta(initial)
+        )
+        cutoffs = generate_cutoffs(df.reset_index(drop=True), horizon, initial, period)
+    else:
+        if min(cutoffs) <= df["ds"].min():
+            raise ValueError("Minimum cutoff value is not strictly greater than "
+                             "min date in history")
+        if max(cutoffs) > df["ds"].max() - horizon:
+            raise ValueError("Maximum cutoff value is greater than end date minus "
+                             "horizon, no value for cross-validation remaining")
+        initial = cutoffs[0] - df["ds"].min()
+
+    if initial < seasonality_dt:
+        logger.warning("Seasonality has period of %s days which is larger than "
+                       "initial window. Consider increasing initial.", period_max)
+
+    return list(cutoffs)
+
+def cutoff_forecast(model, cutoff, horizon, predict_columns):
+    from prophet.diagnostics import single_cutoff_forecast
+
+    df = model.history.copy().reset_index(drop=True)
+    return single_cutoff_forecast(df, model, cutoff, horizon, predict_columns)
+
+def cutoff_rows(model, cutoff):
+    """Number of history rows a model is fit on at cutoff."""
+    return int((model.history["ds"] <= cutoff).sum())
+
+def combine_cutoff_forecasts(forecasts):
+    return pd.concat(forecasts, axis=0).reset_index(drop=True)
+
+
+def _timedelta(value):
+    return pd.Timedelta(value) if value is not None else None
+
+def _column_list(columns):
+    if columns is None:
+        return []
+
+    return [columns] if isinstance(columns, str) else list(columns)
@@ -0,0 +1,242 @@
+import multiprocessing
+import os
+import pickle
+import queue
+import socket
+import struct
+import threading
+from concurrent.futures import Executor, Future
+
+HEADER = struct.Struct("!Q")
+LOOPBACK = "127.0.0.1"
+CHUNK_SIZE = 1 << 20
+# seconds to wait for a started worker to listen, or a stopped one to exit
+START_TIMEOUT = 60
+STOP_TIMEOUT = 10
+
+
+def send_message(sock, message):
+    sock.sendall(pack_message(message))
+
+def pack_message(message):
+    data = pickle.dumps(message, protocol=pickle.HIGHEST_PROTOCOL)
+    return HEADER.pack(len(data)) + data
+
+def receive_message(sock):
+    size, = HEADER.unpack(_receive(sock, HEADER.size))
+    return pickle.loads(_receive(sock, size))
+
+def serve(host=LOOPBACK, port=0, ready=None):
+    """Runs tasks sent by a SocketExecutor until it stops the worker.
+
+    Tasks arrive as pickled (func, args, kwargs) messages and every result or
+    error is sent back on the same connection, a None message stops the
+    worker. ready receives the bound port.
+    Messages are unpickled, so workers must only listen on trusted networks.
+    """
+    with socket.create_server((host, port)) as server:
+        if ready is not None:
+            ready.put(server.getsockname()[1])
+
+        while True:
+            connection, _ = server.accept()
+            with connection:
+                if not _serve_connection(connection):
+                    return
+
+def start_workers(n_workers, host=LOOPBACK):
+    """Starts n_workers worker processes, returns them and their addresses."""
+    context = multiprocessing.get_context("spawn")
+    ready = context.Queue()
+
+    processes = [
+        context.Process(target=serve, args=(host, 0, ready), daemon=True)
+        for _ in range(n_workers)
+    ]
+    for process in processes:
+        process.start()
+
+    try:
+        return processes, [(host, ready.get(timeout=START_TIMEOUT)) for _ in processes]
+    except queue.Empty:
+        for process in processes:
+            process.terminate()
+        raise RuntimeError(f"Workers did not start within {START_TIMEOUT} seconds")
+
+
+class SocketExecutor(Executor):
+    """Executor that runs tasks on socket workers, one connection per worker.
+
+    Workers are started with serve, on this or other machines, and every
+    task and its result are pickled over the connection. The workers share
+    no memory with this process, so frames are shipped per column, and
+    Parquet paths have to be readable by every worker.
+    """
+
+    remote = True
+
+    def __init__(self, addresses, processes=None):
+        self.addresses = list(addresses)
+        self.processes = processes or []
+        self._max_workers = len(self.addresses)
+        self._tasks = queue.Queue()
+        self._shutdown = False
+        self._lock = threading.Lock()
+        self._workers = len(self.addresses)
+        self._threads = [
+            threading.Thread(target=self._work, args=(address,), daemon=True)
+            for address in self.addresses
+        ]
+        for thread in self._threads:
+            thread.start()
+
+    @classmethod
+    def loopback(cls, max_workers=None):
+        """Executor with max_workers worker processes listening on localhost.
+
+        Stands in for workers on other machines, the workers are stopped when
+        the executor is shut down.
+        """
+        processes, addresses = start_workers(max_workers or os.cpu_count())
+        return cls(addresses, processes)
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError("cannot schedule new futures after shutdown")
+
+            future = Future()
+            self._tasks.put((future, fn, args, kwargs))
+            return future
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._lock:
+            if self._shutdown:
+                return
+            self._shutdown = True
+
+        if cancel_futures:
+            while True:
+                try:
+                    item = self._tasks.get_nowait()
+                except queue.Empty:
+                    break
+                if item is not None:
+                    item[0].cancel()
+
+        for _ in self._threads:
+            self._tasks.put(None)
+
+        if wait:
+            for thread in self._threads:
+                thread.join()
+
+        # workers of this executor exit after the stop message on their
+        # connection, workers that did not receive it are terminated
+        for process in self.processes:
+            if wait:
+                process.join(STOP_TIMEOUT)
+            if process.is_alive():
+                process.terminate()
+                process.join(STOP_TIMEOUT)
+
+    def _work(self, address):
+        try:
+            with socket.create_connection(address) as sock:
+                self._run(sock)
+        except Exception as e:
+            self._lost(e)
+
+    def _run(self, sock):
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                if self.processes:
+                    _stop(sock)
+                return
+
+            future, fn, args, kwargs = item
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                message = pack_message((fn, args, kwargs))
+            except Exception as e:
+                # tasks that can not be pickled, e.g. lambdas, leave the
+                # connection usable
+                future.set_exception(e)
+                continue
+
+            try:
+                sock.sendall(message)
+                ok, value = receive_message(sock)
+            except Exception as e:
+                # the connection is lost, or out of step after a reply that
+                # can not be unpickled
+                future.set_exception(e)
+                raise
+
+            if ok:
+                future.set_result(value)
+            else:
+                future.set_exception(value)
+
+    def _lost(self, error):
+        # remaining workers take over the tasks of a lost worker, once no
+        # worker is left, tasks fail with its error
+        with self._lock:
+            self._workers -= 1
+            if self._workers:
+                return
+
+        while True:
+            item = self._tasks.get()
+            if item is None:
+                return
+            if item[0].set_running_or_notify_cancel():
+                item[0].set_exception(error)
+
+
+def _serve_connection(connection):
+    """Runs the tasks of one connection, returns False when asked to stop."""
+    while True:
+        try:
+            message = receive_message(connection)
+        except ConnectionError:
+            return True
+        except Exception as e:
+            # tasks that can not be unpickled, e.g. of modules missing here
+            send_message(connection, (False, e))
+            continue
+
+        if message is None:
+            return False
+
+        fn, args, kwargs = message
+        try:
+            result = (True, fn(*args, **kwargs))
+        except Exception as e:
+            result = (False, e)
+
+        try:
+            send_message(connection, result)
+        except Exception as e:
+            # results or errors that can not be pickled
+            send_message(connection, (False, RuntimeError(repr(e))))
+
+def _receive(sock, size):
+    data = bytearray()
+    while len(data) < size:
+        chunk = sock.recv(min(size - len(data), CHUNK_SIZE))
+        if not chunk:
+            raise ConnectionError("Connection closed by the other side")
+        data += chunk
+
+    return bytes(data)
+
+def _stop(sock):
+    try:
+        send_message(sock, None)
+    except OSError:
+        # the worker is gone or is terminated by shutdown
+        pass
@@ -0,0 +1,168 @@
+import contextvars
+import os
+from concurrent.futures import (FIRST_COMPLETED, CancelledError, Executor, Future,
+                                ProcessPoolExecutor, ThreadPoolExecutor, wait)
+from contextlib import contextmanager
+# seconds between checks for cancellation while tasks are running
+CANCEL_POLL = 0.1
+
+_cancel_event = contextvars.ContextVar("cancel_event", default=None)
+
+
+class SerialExecutor(Executor):
+    """Runs every task in the calling thread, as if no executor was given."""
+
+    _max_workers = 1
+
+    def submit(self, fn, /, *args, **kwargs):
+        future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+        return future
+
+
+def _loopback_executor(max_workers=None):
+    from .distributed import SocketExecutor
+
+    return SocketExecutor.loopback(max_workers)
+
+BACKENDS = {
+    "serial": lambda max_workers=None: SerialExecutor(),
+    "thread": ThreadPoolExecutor,
+    "process": ProcessPoolExecutor,
+    "loopback": _loopback_executor,
+}
+
+
+def register_backend(name, factory):
+    """Makes an executor backend available by name.
+
+    factory(max_workers=None) returns a concurrent.futures.Executor. Tasks
+    are submitted as module level functions with picklable arguments, so any
+    executor that pickles them to other processes or machines can run them.
+    Executors whose workers can not read the memory of this process, such as
+    workers on other machines, set a `remote = True` attribute, and a
+    `_max_workers` attribute is used to plan schedules.
+    """
+    BACKENDS[name] = factory
+
+def resolve_executor(executor=None, n_jobs=None):
+    if isinstance(executor, str):
+        workers = None if n_jobs is None or n_jobs < 0 else n_jobs
+        return create_executor(executor, workers), True
+
+    if executor is not None:
+        return executor, False
+
+    if n_jobs is None or n_jobs == 1:
+        return None, False
+
+    if n_jobs < 0:
+        n_jobs = os.cpu_count()
+
+    return ProcessPoolExecutor(max_workers=n_jobs), True
+
+def create_executor(backend="thread", max_workers=None):
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown executor backend {backend}, "
+                         f"use one of {', '.join(BACKENDS)}")
+
+    return BACKENDS[backend](max_workers=max_workers)
+
+@contextmanager
+def executor_scope(executor=None, n_jobs=None):
+    executor, owned = resolve_executor(executor, n_jobs)
+    try:
+        yield executor
+    finally:
+        if owned:
+            executor.shutdown()
+
+def max_workers(executor):
+    if executor is None:
+        return 1
+
+    return getattr(executor, "_max_workers", None) or os.cpu_count()
+
+def is_process_executor(executor):
+    """Whether tasks run in other processes, so their data is transferred."""
+    return isinstance(executor, ProcessPoolExecutor) or is_remote_executor(executor)
+
+def is_remote_executor(executor):
+    """Whether tasks may run on other machines, without access to shared memory."""
+    return getattr(executor, "remote", False)
+
+@contextmanager
+def cancellation(event):
+    """Cancels run_tasks called in this context once event is set.
+
+    Tasks that were not started are dropped and run_tasks raises
+    CancelledError, results of tasks that are still running are discarded.
+    """
+    token = _cancel_event.set(event)
+    try:
+        yield
+    finally:
+        _cancel_event.reset(token)
+
+def run_tasks(func, tasks, executor=None, max_pending=None):
+    """Runs func(*args) for every (column, args) task.
+
+    Yields (column, result, error) triples in completion order, so a failing
+    column never prevents the remaining columns from being processed. Tasks
+    run in the current process when no executor is given. With max_pending,
+    at most that many tasks are submitted to the executor at a time, which
+    bounds the memory held by tasks and unconsumed results.
+    """
+    cancel = _cancel_event.get()
+    if executor is None or isinstance(executor, SerialExecutor):
+        return _run_serial(func, tasks, cancel)
+    else:
+        return _run_parallel(func, tasks, executor, max_pending, cancel)
+
+def _run_serial(func, tasks, cancel):
+    for column, args in tasks:
+        _check_cancelled(cancel)
+        try:
+            yield column, func(*args), None
+        except Exception as e:
+            yield column, None, e
+
+def _run_parallel(func, tasks, executor, max_pending, cancel):
+    tasks = iter(tasks)
+    futures = {}
+    timeout = None if cancel is None else CANCEL_POLL
+
+    try:
+        while True:
+            for column, args in tasks:
+                futures[executor.submit(func, *args)] = column
+                if max_pending and len(futures) >= max_pending:
+                    break
+
+            if not futures:
+                return
+
+            done = set()
+            while not done:
+                _check_cancelled(cancel)
+                done, _ = wait(futures.keys(), timeout=timeout,
+                               return_when=FIRST_COMPLETED)
+
+            for future in done:
+                _check_cancelled(cancel)
+                column = futures.pop(future)
+                try:
+                    yield column, future.result(), None
+                except Exception as e:
+                    yield column, None, e
+    finally:
+        for future in futures:
+            future.cancel()
+
+def _check_cancelled(cancel):
+    if cancel is not None and cancel.is_set():
+        raise CancelledError()
@@ -8,9 +8,9 @@ def model_pool_factory(columns=None, config=None, regressors={}, **kwargs):
     else:
         return _equal_models_pool_factory(columns, regressors, **kwargs)
 
-def dataframe_builder_factory(regressors):
+def dataframe_builder_factory(regressors, id_column=None, value_column="y"):
     regressors = {c: _map_regressor_name(regressors[c]) for c in regressors.keys()}
-    return DataFrameBuilder(regressors)
+    return DataFrameBuilder(regressors, id_column=id_column, value_column=value_column)
 
 def _different_models_pool_factory(config, regressors):
     return {
@@ -0,0 +1,54 @@
+import hashlib
+import numpy as np
+import pandas as pd
+
+# dtype kinds whose raw bytes identify their values
+RAW_KINDS = "biufcmM"
+
+
+def fit_fingerprint(df, model, fit_kwargs):
+    """Fingerprint of a training frame together with the model configuration."""
+    return fingerprint(df, fit_config(model, fit_kwargs))
+
+def fit_config(model, fit_kwargs):
+    """Configuration of a fit, without the frame, for fingerprints taken in tasks."""
+    return model.kwargs, model.components, fit_kwargs
+
+def fingerprint(*values):
+    digest = hashlib.blake2b(digest_size=16)
+    for value in values:
+        _update(digest, value)
+
+    return digest.hexdigest()
+
+
+def _update(digest, value):
+    if isinstance(value, pd.DataFrame):
+        digest.update(repr((list(value.columns), len(value))).encode())
+        for column in value.columns:
+            _update_values(digest, value[column])
+    elif isinstance(value, pd.Series):
+        digest.update(repr((value.name, len(value))).encode())
+        _update_values(digest, value)
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value.keys(), key=repr):
+            _update(digest, key)
+            _update(digest, value[key])
+        digest.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        digest.update(b"[")
+        for item in value:
+            _update(digest, item)
+        digest.update(b"]")
+    else:
+        digest.update(repr(value).encode())
+
+def _update_values(digest, series):
+    values = series.to_numpy()
+    if values.dtype.kind in RAW_KINDS:
+        # hashing the raw bytes is much faster than hashing row by row
+        digest.update(values.dtype.str.encode())
+        digest.update(np.ascontiguousarray(values).view(np.uint8))
+    else:
+        digest.update(pd.util.hash_pandas_object(series, index=False).values.tobytes())
@@ -0,0 +1,276 @@
+import copy
+import pickle
+import re
+import threading
+import numpy as np
+import pandas as pd
+import prophet
+
+from .caching import LRUCache
+from .fingerprints import fingerprint
+from .holiday_tables import country_holidays_df
+from .instrumentation import annotate, recording, span
+
+_backends = {}
+_backends_lock = threading.Lock()
+
+REGRESSOR_FEATURE_PROPS = ["prior_scale", "standardize", "mu", "std", "mode"]
+STAN_PARAMS = ["k", "m", "delta", "beta", "sigma_obs"]
+# iteration rows of the LBFGS and BFGS output, and iteration lines of Newton
+ITERATION_LINE = re.compile(r"^\s*(?:(\d+)\s+-?\d|Iteration\s+(\d+)\.)", re.MULTILINE)
+
+# backends whose fits report optimizer iterations, pystan 2 only returns
+# the optimum
+ITERATION_BACKENDS = ["CMDSTANPY"]
+
+# every entry is a feature matrix as long as its frame, so the cache is
+# bounded in bytes as well
+FEATURE_CACHE_BYTES = 256 * 2**20
+
+
+def _features_size(cached):
+    (features, _, component_cols, _), _ = cached
+    return int(features.memory_usage(deep=True).sum() +
+               component_cols.memory_usage(deep=True).sum())
+
+# seasonality, holiday and regressor features shared by every model of the process
+feature_cache = LRUCache(maxsize=128,
+                         maxbytes=FEATURE_CACHE_BYTES,
+                         sizeof=_features_size)
+
+
+def load_stan_backend(name=None):
+    """Returns a Stan backend that shares the compiled model of this process.
+
+    The compiled Stan model is loaded from disk only once per process and
+    backend type. Every call returns a shallow copy, so fit results stored on
+    the backend are never shared between models.
+    """
+    with _backends_lock:
+        if name not in _backends:
+            backend = prophet.Prophet(stan_backend=name).stan_backend
+            _backends[name] = backend
+            _backends.setdefault(backend.get_type(), backend)
+
+    return copy.copy(_backends[name])
+
+
+class CachedProphet(prophet.Prophet):
+    """Prophet model that uses the Stan backend cached in the current process.
+
+    The backend is not pickled with the model. It is attached again from the
+    cache of the process that unpickles it, which keeps the model cheap to
+    send to worker processes.
+    """
+
+    def _load_stan_backend(self, stan_backend):
+        self.stan_backend = load_stan_backend(stan_backend)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.stan_backend is not None:
+            state["stan_backend"] = self.stan_backend.get_type()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._load_stan_backend(state["stan_backend"])
+
+    def fit(self, df, init_params=None, **kwargs):
+        """Fits the model, optionally starting the optimizer from init_params.
+
+        init_params are the params of a previously fitted model. Parameters
+        whose shape changed, for example because the number of changepoints
+        or regressors is different, start from the default initialization.
+        """
+        backend = self.stan_backend
+        if init_params is not None:
+            self.stan_backend = _WarmStartBackend(self.stan_backend, init_params)
+        if recording():
+            self.stan_backend = _ProfiledBackend(self.stan_backend)
+
+        try:
+            with span("fit"):
+                super().fit(df, **kwargs)
+        finally:
+            self.stan_backend = backend
+
+        self.optimizer_iterations = _optimizer_iterations(backend.stan_fit)
+        annotate(iterations=self.optimizer_iterations)
+        return self
+
+    def predict(self, df=None, *args, **kwargs):
+        with span("predict"):
+            return super().predict(df, *args, **kwargs)
+
+    def compact(self):
+        """Drops the training data that predict and make_future_dataframe don't use.
+
+        Only the last rows of the history are kept, they hold the last timestamp
+        and the step used for the trend uncertainty of single row forecasts.
+        Cross validation and plotting the history need a model that was not
+        compacted.
+        """
+        if self.history is not None:
+            self.history = self.history.iloc[-2:].copy()
+
+        if self.params is not None:
+            self.params = {
+                name: np.ascontiguousarray(value)
+                for name, value in self.params.items()
+                if name in STAN_PARAMS
+            }
+
+        self.stan_fit = None
+        self.stan_backend.stan_fit = None
+        return self
+
+    def make_all_seasonality_features(self, df):
+        with span("features"):
+            key = self._feature_key(df)
+            cached = feature_cache.get(key)
+
+            if cached is None:
+                features = super().make_all_seasonality_features(df)
+                cached = (features, self.train_holiday_names)
+                feature_cache.put(key, cached)
+
+        (seasonal_features, prior_scales, component_cols, modes), names = cached
+        if self.train_holiday_names is None:
+            self.train_holiday_names = names
+
+        return (
+            seasonal_features,
+            list(prior_scales),
+            component_cols,
+            {mode: list(components) for mode, components in modes.items()}
+        )
+
+    def construct_holiday_dataframe(self, dates):
+        if self.country_holidays is None:
+            return super().construct_holiday_dataframe(dates)
+
+        years = pd.DatetimeIndex(dates).year.unique()
+        table = country_holidays_df(self.country_holidays, years)
+        # keeps the shared table alive while this model uses it
+        self.holiday_tables = {self.country_holidays: table}
+
+        holidays, country_holidays = self.holidays, self.country_holidays
+        if holidays is None:
+            self.holidays = table
+        else:
+            self.holidays = pd.concat((holidays, table), sort=False, ignore_index=True)
+        self.country_holidays = None
+
+        try:
+            return super().construct_holiday_dataframe(dates)
+        finally:
+            self.holidays, self.country_holidays = holidays, country_holidays
+
+    def _feature_key(self, df):
+        conditions = [
+            props["condition_name"] for props in self.seasonalities.values()
+            if props["condition_name"] is not None
+        ]
+        columns = ["ds"] + list(self.extra_regressors.keys()) + conditions
+
+        return fingerprint(
+            df[list(dict.fromkeys(columns))],
+            self.seasonalities,
+            self.holidays,
+            self.country_holidays,
+            self.holidays_mode,
+            self.holidays_prior_scale,
+            self.train_holiday_names,
+            {
+                name: [props.get(p) for p in REGRESSOR_FEATURE_PROPS]
+                for name, props in self.extra_regressors.items()
+            }
+        )
+
+
+class _WarmStartBackend:
+    def __init__(self, backend, params):
+        self.backend = backend
+        self.params = params
+
+    def fit(self, stan_init, stan_data, **kwargs):
+        return self.backend.fit(self._init(stan_init), stan_data, **kwargs)
+
+    def sampling(self, stan_init, stan_data, samples, **kwargs):
+        return self.backend.sampling(self._init(stan_init),
+                                     stan_data,
+                                     samples,
+                                     **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
+    def _init(self, stan_init):
+        return warm_start_init(stan_init, self.params)
+
+
+class _ProfiledBackend:
+    def __init__(self, backend):
+        self.backend = backend
+
+    def fit(self, *args, **kwargs):
+        with span("optimize"):
+            return self.backend.fit(*args, **kwargs)
+
+    def sampling(self, *args, **kwargs):
+        with span("optimize"):
+            return self.backend.sampling(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.backend, name)
+
+
+def warm_start_init(stan_init, params):
+    init = dict(stan_init)
+
+    for name, default in stan_init.items():
+        if name not in params:
+            continue
+
+        value = np.asarray(params[name], dtype=float).mean(axis=0)
+        if np.ndim(default) == 0 and value.size == 1:
+            init[name] = float(value[0])
+        elif np.shape(default) == value.shape:
+            init[name] = value
+
+    return init
+
+def reports_iterations(stan_backend=None):
+    """Whether fits on stan_backend, or the default backend, count iterations."""
+    return load_stan_backend(stan_backend).get_type() in ITERATION_BACKENDS
+
+def _optimizer_iterations(stan_fit):
+    """Iterations of a cmdstanpy optimization, read from its console output.
+
+    Saving every iterate to count them doubles the fit time of long
+    histories, while the output ends with the last iteration.
+    """
+    runset = getattr(stan_fit, "runset", None)
+    files = getattr(runset, "stdout_files", None)
+    if not files:
+        return None
+
+    try:
+        with open(files[0]) as f:
+            output = f.read()
+    except OSError:
+        return None
+
+    iterations = ITERATION_LINE.findall(output)
+    return int("".join(iterations[-1])) if iterations else None
+
+def compacted(model):
+    """Compacted copy of model, model itself keeps its history and fit results."""
+    model = copy.copy(model)
+    model.stan_backend = copy.copy(model.stan_backend)
+    return model.compact()
+
+def model_size(model):
+    """Size of a model in bytes, measured as the size of its pickle."""
+    return len(pickle.dumps(model, protocol=pickle.HIGHEST_PROTOCOL))
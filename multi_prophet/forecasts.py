@@ -0,0 +1,62 @@
+import pandas as pd
+
+from .data_builder import TIME_COLUMN
+
+SERIES_COLUMN = "column"
+DEFAULT_COMPONENTS = ["yhat", "yhat_lower", "yhat_upper"]
+LAYOUTS = ["long", "wide"]
+
+
+def trim_forecast(forecast, components=None, dtype=None):
+    components = components or DEFAULT_COMPONENTS
+    forecast = forecast[[TIME_COLUMN] + list(components)]
+
+    if dtype is not None:
+        forecast = forecast.astype({c: dtype for c in components})
+
+    return forecast
+
+def validate_layout(layout):
+    if layout not in LAYOUTS:
+        raise ValueError(f"Unknown layout {layout}, use one of {', '.join(LAYOUTS)}")
+
+def combine_forecasts(forecasts, layout="long", components=None, dtype=None,
+                      series_column=None):
+    """Combines per-column forecasts into one data frame.
+
+    The long layout has a row per (ds, column) pair, the wide layout is
+    indexed by ds and has a (column, component) pair of column levels.
+    The long layout names its series column series_column, column by default.
+    """
+    validate_layout(layout)
+
+    items = forecasts.items() if isinstance(forecasts, dict) else forecasts
+    trimmed = {
+        column: trim_forecast(forecast, components, dtype)
+        for column, forecast in items
+    }
+
+    if layout == "long":
+        return _long_forecasts(trimmed, series_column or SERIES_COLUMN)
+    else:
+        return _wide_forecasts(trimmed)
+
+
+def _long_forecasts(forecasts, series_column):
+    columns = list(forecasts.keys())
+    frames = [
+        forecast.assign(**{series_column: column})
+        for column, forecast in forecasts.items()
+    ]
+
+    df = pd.concat(frames, ignore_index=True)
+    df[series_column] = pd.Categorical(df[series_column], categories=columns)
+
+    ordered = [TIME_COLUMN, series_column]
+    return df[ordered + [c for c in df.columns if c not in ordered]]
+
+def _wide_forecasts(forecasts):
+    return pd.concat(
+        {column: forecast.set_index(TIME_COLUMN) for column, forecast in forecasts.items()},
+        axis=1
+    )
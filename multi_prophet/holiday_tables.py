@@ -0,0 +1,27 @@
+import threading
+import weakref
+from prophet.make_holidays import make_holidays_df
+
+# tables are dropped as soon as no model holds a reference to them
+_tables = weakref.WeakValueDictionary()
+_tables_lock = threading.Lock()
+
+
+def country_holidays_df(country, years):
+    """Holiday table of a country, computed once per (country, years).
+
+    The table is shared between models and must not be modified.
+    """
+    key = (country, tuple(sorted(years)))
+
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = make_holidays_df(year_list=list(key[1]), country=country)
+            table = table.reset_index(drop=True)
+            _tables[key] = table
+
+    return table
+
+def cached_tables():
+    return list(_tables.keys())
@@ -0,0 +1,168 @@
+import contextvars
+import json
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+import pandas as pd
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+PHASES = ["build", "fit", "features", "optimize", "predict"]
+TASK_PHASE = "task"
+
+_recorder = contextvars.ContextVar("recorder", default=None)
+_disabled = nullcontext()
+
+
+def span(phase):
+    """Times phase in the task being profiled, a no-op otherwise."""
+    recorder = _recorder.get()
+    return _disabled if recorder is None else recorder.span(phase)
+
+def annotate(**values):
+    """Attaches values, such as iteration counts, to the task being profiled."""
+    recorder = _recorder.get()
+    if recorder is not None:
+        recorder.notes.update(values)
+
+def recording():
+    return _recorder.get() is not None
+
+def process_peak_memory():
+    """Peak resident memory of the current process in bytes, if available.
+
+    This is the high-water mark of the whole process since it started, so
+    tasks that share a process report the same, non-decreasing figure.
+    """
+    if resource is None:
+        return None
+
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # linux reports kilobytes, macOS bytes
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+
+class Recorder:
+    """Collects the phases of a single task.
+
+    Phases can be nested. Each phase records the seconds spent in itself,
+    excluding nested phases, so the phases of a task add up.
+    """
+
+    def __init__(self):
+        self.phases = []
+        self.notes = {}
+        self._nested = []
+
+    @contextmanager
+    def span(self, phase):
+        start = time.perf_counter()
+        self._nested.append(0.0)
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            nested = self._nested.pop()
+            if self._nested:
+                self._nested[-1] += seconds
+            self.phases.append((phase, seconds - nested))
+
+
+class Profiled:
+    """Calls func while recording its phases.
+
+    Returns the result of func together with the recorded phases, total
+    seconds, notes and peak memory of the process that ran it.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, *args):
+        recorder = Recorder()
+        token = _recorder.set(recorder)
+        start = time.perf_counter()
+        try:
+            result = self.func(*args)
+        finally:
+            _recorder.reset(token)
+
+        return result, {
+            "phases": recorder.phases,
+            "seconds": time.perf_counter() - start,
+            "notes": recorder.notes,
+            "process_peak_memory": process_peak_memory(),
+        }
+
+
+class Instrumentation:
+    """Per-column timings of fit, predict and cross validation.
+
+    Every task emits one event per phase (build, fit, features, optimize and
+    predict) and a final task event with its total seconds, optimizer
+    iterations and the peak memory of the process that ran it. Callbacks are called with each event as it arrives.
+    """
+
+    def __init__(self, callbacks=None):
+        self.callbacks = list(callbacks or [])
+        self.events = []
+
+    def record(self, operation, task, profile):
+        # tasks are columns, (column, cutoff) or (column, candidate, cutoff)
+        column, cutoff = (task[0], task[-1]) if isinstance(task, tuple) else (task, None)
+        base = {"operation": operation, "column": column, "cutoff": cutoff}
+
+        for phase, seconds in profile["phases"]:
+            self._emit({**base, "phase": phase, "seconds": seconds})
+
+        self._emit({
+            **base,
+            "phase": TASK_PHASE,
+            "seconds": profile["seconds"],
+            "process_peak_memory": profile["process_peak_memory"],
+            **profile["notes"],
+        })
+
+    def to_frame(self):
+        return pd.DataFrame(self.events)
+
+    def to_json(self, path=None):
+        data = json.dumps(self.events, default=str)
+        if path is None:
+            return data
+
+        with open(path, "w") as f:
+            f.write(data)
+
+    def summary(self):
+        """Seconds per column and phase with peak memory and iterations."""
+        df = self.to_frame()
+        if df.empty:
+            return df
+
+        phases = df[df["phase"] != TASK_PHASE].pivot_table(
+            index=["operation", "column"],
+            columns="phase",
+            values="seconds",
+            aggfunc="sum",
+            fill_value=0.0
+        )
+        tasks = df[df["phase"] == TASK_PHASE].groupby(["operation", "column"])
+        phases["total"] = tasks["seconds"].sum()
+        phases["process_peak_memory"] = tasks["process_peak_memory"].max()
+        if "iterations" in df.columns:
+            phases["iterations"] = tasks["iterations"].sum(min_count=1)
+
+        return phases.reindex(columns=[p for p in PHASES if p in phases.columns] +
+                                      [c for c in phases.columns if c not in PHASES])
+
+    def clear(self):
+        self.events = []
+
+    def _emit(self, event):
+        self.events.append(event)
+        for callback in self.callbacks:
+            callback(event)
@@ -0,0 +1,145 @@
+import os
+from urllib.parse import quote
+import numpy as np
+import pandas as pd
+
+from .data_builder import TIME_COLUMN
+from .forecasts import SERIES_COLUMN, trim_forecast
+
+FORECAST_FILE = "part-0.parquet"
+
+
+def _dataset_module():
+    try:
+        import pyarrow.dataset
+    except ImportError as e:
+        raise ImportError("Parquet support requires pyarrow, "
+                          "install it with pip install pyarrow") from e
+
+    return pyarrow.dataset
+
+def _parquet_module():
+    try:
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError("Parquet support requires pyarrow, "
+                          "install it with pip install pyarrow") from e
+
+    return pyarrow.parquet
+
+
+class ParquetArrays:
+    """Reads single columns of a Parquet dataset on demand.
+
+    Only `ds` is kept after reading, since it is shared by every model. Other
+    columns are read again each time they are requested, so memory does not
+    grow with the number of columns in the file.
+    """
+
+    def __init__(self, dataset):
+        self.dataset = dataset
+        self._time = None
+
+    def __getitem__(self, column):
+        if column != TIME_COLUMN:
+            return self._array(column)
+
+        if self._time is None:
+            self._time = self._array(column)
+
+        return self._time
+
+    def _array(self, column):
+        series = self.dataset.to_table(columns=[column]).column(0).to_pandas()
+        if column == TIME_COLUMN:
+            array = np.asarray(pd.to_datetime(series))
+        else:
+            array = series.to_numpy()
+
+        array = array.view()
+        array.flags.writeable = False
+        return array
+
+
+class ParquetFrame:
+    """Reference to a Parquet file or dataset directory.
+
+    Per-column frames only read `ds`, the target and the cap, floor and
+    regressor columns of that model. Pickling only transfers the path, so
+    worker processes read their own columns.
+    """
+
+    # fit fingerprints are taken by the tasks, which read the columns anyway
+    fingerprinted_in_tasks = True
+
+    def __init__(self, path):
+        self.path = path
+        self._open()
+
+    @property
+    def columns(self):
+        return self.schema.names
+
+    @property
+    def num_rows(self):
+        """Number of rows, from the Parquet metadata."""
+        if self._num_rows is None:
+            self._num_rows = self.arrays.dataset.count_rows()
+
+        return self._num_rows
+
+    def create_df(self, builder, column, train=False):
+        return builder.create_df(self, column, train=train, arrays=self.arrays)
+
+    def series(self, column):
+        return self
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.path = state["path"]
+        self._open()
+
+    def _open(self):
+        dataset = _dataset_module().dataset(self.path, format="parquet")
+        self.schema = dataset.schema
+        self.arrays = ParquetArrays(dataset)
+        self._num_rows = None
+
+
+def write_forecasts(forecasts, path, components=None, dtype=None):
+    """Writes forecasts into a Parquet dataset partitioned by column.
+
+    Forecasts can be a dictionary or any iterable of (column, forecast) pairs,
+    such as MultiProphet.iter_fit_predict. Each forecast is written as soon as
+    it arrives, into path/column=<name>/, replacing an earlier forecast of
+    that column. Returns the list of written columns.
+    """
+    pq = _parquet_module()
+
+    items = forecasts.items() if isinstance(forecasts, dict) else forecasts
+    columns = []
+    for column, forecast in items:
+        forecast = trim_forecast(forecast, components, dtype)
+
+        partition = os.path.join(path, f"{SERIES_COLUMN}={quote(str(column), safe='')}")
+        os.makedirs(partition, exist_ok=True)
+        pq.write_table(_arrow_table(forecast), os.path.join(partition, FORECAST_FILE))
+        columns.append(column)
+
+    return columns
+
+def _arrow_table(df):
+    import pyarrow
+
+    return pyarrow.Table.from_pandas(df, preserve_index=False)
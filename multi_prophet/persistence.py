@@ -0,0 +1,108 @@
+import json
+import os
+import pickle
+
+from .data_builder import DataFrameBuilder
+from .prophet import Prophet
+
+FORMAT_VERSION = 2
+MANIFEST_FILE = "manifest.json"
+MODELS_DIR = "models"
+
+
+class LazyProphet(Prophet):
+    """Prophet wrapper that is deserialized from its file on first use."""
+
+    def __init__(self, path):
+        self._path = path
+
+    @property
+    def loaded(self):
+        return "_path" not in self.__dict__
+
+    def __getattr__(self, name):
+        if name.startswith("__") or self.loaded:
+            raise AttributeError(name)
+
+        self._load()
+        return getattr(self, name)
+
+    def _load(self):
+        with open(self._path, "rb") as f:
+            state = pickle.load(f)
+
+        del self.__dict__["_path"]
+        self.__setstate__(state)
+
+
+def save_pool(model_pool, df_builder, path):
+    os.makedirs(os.path.join(path, MODELS_DIR), exist_ok=True)
+
+    entries = []
+    for i, (column, model) in enumerate(model_pool.items()):
+        file_name = os.path.join(MODELS_DIR, f"{i}.pkl")
+        with open(os.path.join(path, file_name), "wb") as f:
+            pickle.dump(_model_state(model), f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        entries.append({
+            "column": column,
+            "file": file_name,
+            "kwargs": model.kwargs,
+            "components": model.components,
+        })
+
+    manifest = {
+        "format": FORMAT_VERSION,
+        "models": entries,
+        # pairs keep column names that JSON object keys would turn into strings
+        "regressors": [[column, names] for column, names in df_builder.regressors.items()],
+        "id_column": df_builder.id_column,
+        "value_column": df_builder.value_column,
+    }
+    with open(os.path.join(path, MANIFEST_FILE), "w") as f:
+        json.dump(manifest, f, indent=2, default=repr)
+
+def load_manifest(path):
+    with open(os.path.join(path, MANIFEST_FILE)) as f:
+        manifest = json.load(f)
+
+    if manifest["format"] != FORMAT_VERSION:
+        raise ValueError(f"Unsupported model pool format {manifest['format']}")
+
+    return manifest
+
+def load_pool(path, lazy=True):
+    manifest = load_manifest(path)
+
+    model_pool = {}
+    for entry in manifest["models"]:
+        model = LazyProphet(os.path.join(path, entry["file"]))
+        if not lazy:
+            model._load()
+        model_pool[_column(entry["column"])] = model
+
+    regressors = {_column(column): names for column, names in manifest["regressors"]}
+    df_builder = DataFrameBuilder(regressors,
+                                  id_column=manifest.get("id_column"),
+                                  value_column=manifest.get("value_column", "y"))
+    return model_pool, df_builder
+
+
+def _model_state(model):
+    """State of model with a compacted prophet model, as for slim fits.
+
+    The history and the fit results of the Stan backend, which refer to
+    temporary files, are not saved.
+    """
+    from .forecaster import compacted
+
+    if isinstance(model, LazyProphet) and not model.loaded:
+        model._load()
+
+    state = model.__getstate__()
+    state["_prophet"] = compacted(model.prophet)
+    return state
+
+def _column(name):
+    # JSON has no tuples, and lists can not be column names
+    return tuple(_column(part) for part in name) if isinstance(name, list) else name
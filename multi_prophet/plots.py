@@ -1,8 +1,12 @@
-from prophet.plot import plot_plotly, plot_components_plotly
+# prophet.plot imports matplotlib and plotly, so it is only imported when plotting
 
 
 def plotly_plot(model, forecast, **kwargs):
+    from prophet.plot import plot_plotly
+
     return plot_plotly(model, forecast, **kwargs)
 
 def plotly_components_plot(model, forecast, **kwargs):
+    from prophet.plot import plot_components_plotly
+
     return plot_components_plotly(model, forecast, **kwargs)
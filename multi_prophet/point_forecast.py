@@ -0,0 +1,85 @@
+import numpy as np
+import pandas as pd
+
+from .fingerprints import fingerprint
+
+
+def point_forecasts(models, dfs):
+    """Computes yhat for fitted models without the uncertainty simulation.
+
+    Models whose seasonality, holiday and regressor features are identical
+    and whose frames have the same dates share one feature matrix, and yhat
+    of the whole group is computed as one matrix product against their
+    stacked coefficients. Only the trend and the standardized regressor
+    columns are computed per model.
+    """
+    setups = {c: model.setup_dataframe(dfs[c].copy()) for c, model in models.items()}
+
+    forecasts = {}
+    for columns in _feature_groups(models, setups).values():
+        forecasts.update(_group_forecasts(models, setups, columns))
+
+    return {column: forecasts[column] for column in models.keys()}
+
+
+def _feature_groups(models, setups):
+    groups = {}
+    for column, model in models.items():
+        # series of long input can have different dates
+        key = (_feature_key(model), fingerprint(setups[column]["ds"]))
+        groups.setdefault(key, []).append(column)
+
+    return groups
+
+def _feature_key(model):
+    return fingerprint(
+        model.seasonalities,
+        model.holidays,
+        model.country_holidays,
+        model.holidays_mode,
+        model.train_holiday_names,
+        [(name, props["mode"]) for name, props in model.extra_regressors.items()]
+    )
+
+def _group_forecasts(models, setups, columns):
+    first = models[columns[0]]
+
+    features, _, component_cols, _ = first.make_all_seasonality_features(
+        setups[columns[0]]
+    )
+    regressors = list(first.extra_regressors.keys())
+    shared = [f for f in features.columns if f not in regressors]
+    shared_idx = features.columns.get_indexer(shared)
+    regressor_idx = features.columns.get_indexer(regressors)
+
+    additive = component_cols["additive_terms"].values
+    multiplicative = component_cols["multiplicative_terms"].values
+
+    betas = np.column_stack([
+        np.nanmean(models[c].params["beta"], axis=0) for c in columns
+    ])
+    y_scales = np.array([models[c].y_scale for c in columns])
+    additive_betas = betas * additive[:, None] * y_scales
+    multiplicative_betas = betas * multiplicative[:, None]
+
+    X = features[shared].values
+    additive_terms = X @ additive_betas[shared_idx]
+    multiplicative_terms = X @ multiplicative_betas[shared_idx]
+
+    forecasts = {}
+    for i, column in enumerate(columns):
+        model = models[column]
+        setup = setups[column]
+
+        if regressors:
+            X_r = setup[regressors].values
+            additive_terms[:, i] += X_r @ additive_betas[regressor_idx, i]
+            multiplicative_terms[:, i] += X_r @ multiplicative_betas[regressor_idx, i]
+
+        trend = np.asarray(model.predict_trend(setup))
+        forecasts[column] = pd.DataFrame({
+            "ds": setup["ds"].values,
+            "yhat": trend * (1 + multiplicative_terms[:, i]) + additive_terms[:, i]
+        })
+
+    return forecasts
@@ -1,14 +1,101 @@
-import prophet
-from prophet.diagnostics import cross_validation, performance_metrics
+import uuid
 from . import plots
+from .diagnostics import cv_key, cross_validation, performance_metrics
 
 
 class Prophet:
     def __init__(self, **kwargs):
-        self.prophet = prophet.Prophet(**kwargs)
+        self.kwargs = kwargs
+        self.components = []
+        self.iterations = None
+        self.cold_iterations = None
+        self.warm_started = False
+        self.fingerprint = None
+        self.prophet = _forecaster().CachedProphet(**kwargs)
 
-    def fit(self, df, **kwargs):
-        self.prophet.fit(df, **kwargs)
+    @property
+    def prophet(self):
+        return self._prophet
+
+    @prophet.setter
+    def prophet(self, model):
+        self._prophet = model
+        self.cv_cache = {}
+        self._new_version()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["cv_cache"] = {}
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if "version" not in state:
+            self._new_version()
+
+    @property
+    def fitted(self):
+        return self.prophet.history is not None
+
+    @property
+    def iteration_delta(self):
+        """Iterations of the last cold fit minus those of this warm fit.
+
+        The cold fit may have had a different history, so this is a rough
+        measure of what warm starting saved and can be negative. None after
+        cold fits and on backends that do not report iterations.
+        """
+        if not self.warm_started or None in (self.iterations, self.cold_iterations):
+            return None
+
+        return self.cold_iterations - self.iterations
+
+    def fit(self, df, warm_start=False, **kwargs):
+        model, init_params = self.prepare_fit(warm_start)
+        model.fit(df, init_params=init_params, **kwargs)
+        self.finish_fit(model, warm_start)
+
+    def prepare_fit(self, warm_start=False):
+        """Returns the model to fit and the params to warm start it from.
+
+        A fitted prophet model can not be fitted again, so refits use a new
+        model built from the same configuration.
+        """
+        if not self.fitted:
+            return self.prophet, None
+
+        init_params = self.prophet.params if warm_start else None
+        return self.build(), init_params
+
+    def finish_fit(self, model, warm_start=False, fingerprint=None):
+        self.prophet = model
+        self.fingerprint = fingerprint
+        self.warm_started = warm_start
+        self.iterations = getattr(model, "optimizer_iterations", None)
+        if not warm_start or self.cold_iterations is None:
+            self.cold_iterations = self.iterations
+
+    def compact(self):
+        model_size = _forecaster().model_size
+        before = model_size(self.prophet)
+        self.prophet.compact()
+        self.cv_cache = {}
+        return {"before": before, "after": model_size(self.prophet)}
+
+    def build(self):
+        model = _forecaster().CachedProphet(**self.kwargs)
+        for method, kwargs in self.components:
+            getattr(model, method)(**kwargs)
+
+        return model
+
+    def configured(self, **params):
+        """New unfitted model with params overriding its kwargs."""
+        model = Prophet(**{**self.kwargs, **params})
+        for method, kwargs in self.components:
+            model._add_component(method, **kwargs)
+
+        return model
 
     def make_future_dataframe(self, periods, **kwargs):
         return self.prophet.make_future_dataframe(periods=periods, **kwargs)
@@ -17,13 +104,13 @@ class Prophet:
         return self.prophet.predict(future_df)
 
     def add_seasonality(self, **kwargs):
-        self.prophet.add_seasonality(**kwargs)
+        self._add_component("add_seasonality", **kwargs)
 
     def add_country_holidays(self, country_name):
-        self.prophet.add_country_holidays(country_name=country_name)
+        self._add_component("add_country_holidays", country_name=country_name)
 
     def add_regressor(self, name, **kwargs):
-        self.prophet.add_regressor(name, **kwargs)
+        self._add_component("add_regressor", name=name, **kwargs)
 
     def plot(self, forecast, plotly=False, **kwargs):
         if plotly:
@@ -37,9 +124,46 @@ class Prophet:
         else:
             return self.prophet.plot_components(forecast)
 
-    def cross_validation(self, horizon, **kwargs):
-        return cross_validation(self.prophet, horizon=horizon, **kwargs)
+    def cross_validation(self, horizon, period=None, initial=None, cutoffs=None,
+                         **kwargs):
+        key = cv_key(horizon, period, initial, cutoffs,
+                     kwargs.get("extra_output_columns"))
+
+        if key not in self.cv_cache:
+            self.cv_cache[key] = cross_validation(self.prophet,
+                                                  horizon=horizon,
+                                                  period=period,
+                                                  initial=initial,
+                                                  cutoffs=cutoffs,
+                                                  **kwargs)
+
+        return self.cv_cache[key].copy()
+
+    def performance_metrics(self, horizon, cv_df=None, metrics=None,
+                            rolling_window=0.1, **kwargs):
+        if cv_df is None:
+            cv_df = self.cross_validation(horizon=horizon, **kwargs)
+
+        return performance_metrics(cv_df,
+                                   metrics=metrics,
+                                   rolling_window=rolling_window)
+
+    def _add_component(self, method, **kwargs):
+        # fitted models pick up new components on the next fit
+        if not self.fitted:
+            getattr(self.prophet, method)(**kwargs)
+
+        self.components.append((method, kwargs))
+        self._new_version()
+
+    def _new_version(self):
+        # identifies the model and its components, e.g. for cached predictions
+        self.version = uuid.uuid4().hex
+
+
+def _forecaster():
+    # importing prophet loads the Stan backend and matplotlib, so it is
+    # deferred until the first model is built
+    from . import forecaster
 
-    def performance_metrics(self, horizon, **kwargs):
-        cv_df = cross_validation(self.prophet, horizon=horizon, **kwargs)
-        return performance_metrics(cv_df)
+    return forecaster
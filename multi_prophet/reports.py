@@ -0,0 +1,33 @@
+class FitReport:
+    def __init__(self):
+        self.fitted = []
+        self.reused = []
+        self.errors = {}
+        self.iterations = {}
+        self.iteration_delta = {}
+        self.memory = {}
+        self.schedule = None
+
+    def add_fitted(self, column, model):
+        self.fitted.append(column)
+        self.iterations[column] = model.iterations
+        self.iteration_delta[column] = model.iteration_delta
+
+
+class TuneReport:
+    def __init__(self, metric):
+        self.metric = metric
+        self.best = {}
+        self.scores = {}
+        self.errors = {}
+        self.results = None
+        self.fit_report = None
+
+
+class FitError(Exception):
+    def __init__(self, report):
+        self.report = report
+        self.errors = report.errors
+
+        columns = ", ".join(str(c) for c in report.errors.keys())
+        super().__init__(f"Fitting failed for columns: {columns}")
@@ -0,0 +1,96 @@
+import heapq
+import time
+
+MCMC_COST = 0.05
+COMPONENT_COST = 0.1
+LEARNING_RATE = 0.5
+
+
+def estimate_cost(rows, model):
+    """Relative cost of fitting model on rows of history.
+
+    Grows linearly with the history length and the number of seasonalities,
+    regressors and holidays added to the model, and with the number of MCMC
+    samples. Only the ratio between columns matters.
+    """
+    mcmc_samples = model.kwargs.get("mcmc_samples", 0)
+    cost = rows * (1 + COMPONENT_COST * len(model.components))
+
+    if mcmc_samples:
+        cost *= 1 + MCMC_COST * mcmc_samples
+
+    return cost
+
+
+class CostModel:
+    """Learns seconds per unit of estimated cost from past runtimes.
+
+    Every column keeps a moving average of its own rate. Columns that were
+    never timed use the average rate over all columns.
+    """
+
+    def __init__(self):
+        self.rates = {}
+        self.rate = None
+
+    def estimate(self, column, cost):
+        rate = self.rates.get(column, self.rate)
+        return cost if rate is None else cost * rate
+
+    def learn(self, column, cost, seconds):
+        rate = seconds / max(cost, 1)
+        self.rates[column] = _average(self.rates.get(column), rate)
+        self.rate = _average(self.rate, rate)
+
+
+class Schedule:
+    """Longest-first order of tasks and its planned assignment to workers.
+
+    Tasks are dispatched in order, so with a pool executor every idle worker
+    takes the longest remaining task. After the run, runtimes has the
+    measured seconds of each task and makespan the wall time of the run.
+    """
+
+    def __init__(self, estimates, workers=1):
+        self.order = sorted(estimates.keys(), key=estimates.__getitem__, reverse=True)
+        self.estimates = estimates
+        self.workers = workers
+        self.assignments = {}
+        self.runtimes = {}
+        self.makespan = None
+
+        loads = [(0.0, worker) for worker in range(workers)]
+        for task in self.order:
+            load, worker = heapq.heappop(loads)
+            self.assignments[task] = worker
+            heapq.heappush(loads, (load + estimates[task], worker))
+
+        self.estimated_makespan = max(load for load, _ in loads) if loads else 0.0
+
+    def start(self):
+        self._start = time.perf_counter()
+
+    def finish(self):
+        self.makespan = time.perf_counter() - self._start
+
+
+class Timed:
+    """Calls func and returns its result together with the elapsed seconds.
+
+    Runs inside the worker, so the time excludes queueing and transfer.
+    """
+
+    def __init__(self, func):
+        self.func = func
+
+    def __call__(self, *args):
+        start = time.perf_counter()
+        result = self.func(*args)
+        return result, time.perf_counter() - start
+
+
+def _average(current, value):
+    if current is None:
+        return value
+
+    return (1 - LEARNING_RATE) * current + LEARNING_RATE * value
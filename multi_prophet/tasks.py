@@ -0,0 +1,50 @@
+from .fingerprints import fingerprint
+from .instrumentation import span
+from .tuning import forecast_errors
+
+
+def fit_model(model, init_params, data, column, builder, kwargs):
+    with span("build"):
+        df = data.create_df(builder, column, train=True)
+
+    model.fit(df, init_params=init_params, **kwargs)
+    return model
+
+def fit_changed_model(model, init_params, data, column, builder, kwargs, config,
+                      previous):
+    """Fits model unless its frame and config fingerprint to previous.
+
+    Returns the fitted model, or None when nothing changed, and the
+    fingerprint, so the frame is only read here.
+    """
+    with span("build"):
+        df = data.create_df(builder, column, train=True)
+        digest = fingerprint(df, config)
+
+    if digest == previous:
+        return None, digest
+
+    model.fit(df, init_params=init_params, **kwargs)
+    return model, digest
+
+def predict_model(model, data, column, builder):
+    with span("build"):
+        df = data.create_df(builder, column)
+
+    return model.predict(df)
+
+def fit_predict_model(model, init_params, train_data, future_data, column, builder,
+                      kwargs):
+    model = fit_model(model, init_params, train_data, column, builder, kwargs)
+    return model, predict_model(model, future_data, column, builder)
+
+def cutoff_errors(model, data, column, builder, cutoff, horizon):
+    """Fits model on the history up to cutoff and sums its errors over horizon."""
+    with span("build"):
+        df = data.create_df(builder, column, train=True)
+        train = df[df["ds"] <= cutoff]
+        test = df[(df["ds"] > cutoff) & (df["ds"] <= cutoff + horizon)].dropna(subset=["y"])
+
+    model.fit(train)
+    forecast = model.predict(test.drop(columns="y"))
+    return forecast_errors(test["y"], forecast["yhat"])
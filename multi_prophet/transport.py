@@ -0,0 +1,232 @@
+from multiprocessing import shared_memory
+import numpy as np
+import pandas as pd
+
+from .data_builder import TIME_COLUMN, ColumnArrays
+from .executors import is_process_executor, is_remote_executor
+
+ALIGNMENT = 16
+
+
+class LocalFrame:
+    """Reference to a data frame living in the current process."""
+
+    def __init__(self, df):
+        self.df = df
+        self.arrays = ColumnArrays(df)
+
+    def create_df(self, builder, column, train=False, rows=None):
+        if rows is None:
+            return builder.create_df(self.df, column, train=train, arrays=self.arrays)
+
+        return builder.create_series_df(self.df, column, rows, train=train,
+                                        arrays=self.arrays)
+
+    def series(self, column):
+        return self
+
+    def select(self, rows):
+        return SeriesFrame(self, rows)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class RemoteFrame:
+    """Data frame whose per-column parts are shipped to remote workers.
+
+    Remote workers can not attach to shared memory, so every task carries
+    its own data. series and select return frames with only the input
+    columns of one model or the rows of one series, so a task pickles its
+    share of the data rather than the whole frame.
+    """
+
+    def __init__(self, df, inputs=None):
+        self.local = LocalFrame(df)
+        self.inputs = inputs
+
+    def create_df(self, builder, column, train=False, rows=None):
+        return self.local.create_df(builder, column, train=train, rows=rows)
+
+    def series(self, column):
+        if self.inputs is None:
+            return self.local
+
+        return LocalFrame(self.local.df[self.inputs(column)])
+
+    def select(self, rows):
+        df = self.local.df.iloc[rows].reset_index(drop=True)
+        return SeriesFrame(LocalFrame(df), slice(None))
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class SharedFrame:
+    """Numeric columns of a data frame copied once into shared memory.
+
+    Pickling a SharedFrame only transfers the name of the memory block and the
+    layout of the columns. Workers attach to the block and build their
+    per-column frames from zero-copy NumPy views. Non numeric columns are
+    pickled as usual.
+    """
+
+    def __init__(self, df, columns):
+        arrays = {c: _column_array(df, c) for c in dict.fromkeys(columns)}
+        numeric = {c: a for c, a in arrays.items() if a.dtype.kind != "O"}
+
+        self.objects = {c: a for c, a in arrays.items() if c not in numeric}
+        self.layout = {}
+
+        offset = 0
+        for c, a in numeric.items():
+            self.layout[c] = (a.dtype.str, a.shape, offset)
+            offset += _aligned(a.nbytes)
+
+        self._shm = shared_memory.SharedMemory(create=True, size=max(offset, 1))
+        self._owner = True
+        self.name = self._shm.name
+
+        for c, a in numeric.items():
+            self._view(self._shm, c)[...] = a
+
+    def create_df(self, builder, column, train=False, rows=None):
+        shm = self._shm or _attach(self.name)
+        try:
+            df = self._frame(shm)
+            if rows is None:
+                return builder.create_df(df, column, train=train).copy()
+
+            return builder.create_series_df(df, column, rows, train=train).copy()
+        finally:
+            if shm is not self._shm:
+                shm.close()
+
+    def series(self, column):
+        return self
+
+    def select(self, rows):
+        return SeriesFrame(self, rows)
+
+    def close(self):
+        if self._shm is not None and self._owner:
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        return {"name": self.name, "layout": self.layout, "objects": self.objects}
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._shm = None
+        self._owner = False
+
+    def _frame(self, shm):
+        data = {c: self._view(shm, c) for c in self.layout.keys()}
+        data.update(self.objects)
+        return pd.DataFrame(data, copy=False)
+
+    def _view(self, shm, column):
+        dtype, shape, offset = self.layout[column]
+        return np.ndarray(shape, dtype=np.dtype(dtype), buffer=shm.buf, offset=offset)
+
+
+class LongFrame:
+    """Long format data frame grouped by series in a single sort.
+
+    The input columns are reordered once so that the rows of every series
+    are contiguous, and each series frame is a slice of them. The reordered
+    columns are held by a LocalFrame, a SharedFrame or a RemoteFrame.
+    """
+
+    def __init__(self, df, id_column, columns, executor=None):
+        codes, ids = pd.factorize(df[id_column])
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(ids) + 1))
+
+        self.rows = {
+            series: slice(int(bounds[i]), int(bounds[i + 1]))
+            for i, series in enumerate(ids)
+        }
+        self.data = frame_reference(df[columns].take(order), columns, executor)
+
+    def create_df(self, builder, column, train=False):
+        return self.series(column).create_df(builder, column, train=train)
+
+    def series(self, column):
+        """Returns a reference to the rows of one series, cheap to pickle."""
+        if column not in self.rows:
+            raise ValueError(f"No rows for series {column}")
+
+        return self.data.select(self.rows[column])
+
+    def close(self):
+        self.data.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class SeriesFrame:
+    """Rows of one series in a grouped long format data frame."""
+
+    def __init__(self, data, rows):
+        self.data = data
+        self.rows = rows
+
+    def create_df(self, builder, column, train=False):
+        return self.data.create_df(builder, column, train=train, rows=self.rows)
+
+
+def _column_array(df, column):
+    if column == TIME_COLUMN:
+        return np.asarray(pd.to_datetime(df[column]))
+
+    return np.asarray(df[column])
+
+def _aligned(nbytes):
+    return -(-nbytes // ALIGNMENT) * ALIGNMENT
+
+def _attach(name):
+    try:
+        return shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:
+        return shared_memory.SharedMemory(name=name)
+
+def frame_reference(df, columns, executor=None, id_column=None, inputs=None):
+    """Reference to the input columns of df for tasks run on executor.
+
+    inputs(column) returns the input columns of one model, so that remote
+    tasks only receive those.
+    """
+    if id_column is not None:
+        return LongFrame(df, id_column, columns, executor)
+
+    if is_remote_executor(executor):
+        return RemoteFrame(df[columns], inputs)
+    elif is_process_executor(executor):
+        return SharedFrame(df, columns)
+    else:
+        return LocalFrame(df)
@@ -0,0 +1,85 @@
+import itertools
+import numpy as np
+import pandas as pd
+
+from .diagnostics import plan_cutoffs
+
+METRICS = ["mse", "rmse", "mae", "mape"]
+YEARLY_PERIOD = 365.25
+WEEKLY_PERIOD = 7.
+
+
+def candidates(param_grid):
+    """Parameter dicts of a grid of {name: values}, or a list of dicts as is."""
+    if isinstance(param_grid, dict):
+        names = list(param_grid.keys())
+        return [
+            dict(zip(names, values))
+            for values in itertools.product(*(param_grid[n] for n in names))
+        ]
+
+    return [dict(params) for params in param_grid]
+
+def validate_metric(metric):
+    if metric not in METRICS:
+        raise ValueError(f"Unknown metric {metric}, use one of {', '.join(METRICS)}")
+
+def tuning_cutoffs(model, history, horizon, period=None, initial=None, cutoffs=None):
+    """Cutoffs for tuning model on history, before it has been fitted.
+
+    The longest seasonality is taken from added seasonalities and from the
+    yearly and weekly seasonalities prophet adds automatically for this
+    history.
+    """
+    periods = [kwargs["period"] for method, kwargs in model.components
+               if method == "add_seasonality"]
+
+    span = history["ds"].max() - history["ds"].min()
+    if span >= pd.Timedelta(days=730) and model.kwargs.get("yearly_seasonality", "auto"):
+        periods.append(YEARLY_PERIOD)
+    if span >= pd.Timedelta(days=14) and model.kwargs.get("weekly_seasonality", "auto"):
+        periods.append(WEEKLY_PERIOD)
+
+    return plan_cutoffs(history, horizon, period, initial, cutoffs,
+                        max(periods, default=0.))
+
+def forecast_errors(y, yhat):
+    """Sums of errors of a forecast, which add up over cutoffs."""
+    errors = np.asarray(y, dtype=float) - np.asarray(yhat, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ape = np.abs(errors / np.asarray(y, dtype=float))
+
+    return {
+        "n": len(errors),
+        "se": float(np.sum(errors ** 2)),
+        "ae": float(np.sum(np.abs(errors))),
+        "ape": float(np.sum(ape)),
+    }
+
+def add_errors(total, errors):
+    if total is None:
+        return dict(errors)
+
+    return {name: total[name] + errors[name] for name in total.keys()}
+
+def score(errors, metric):
+    n = errors["n"]
+    if n == 0:
+        return np.inf
+
+    if metric == "mse":
+        return errors["se"] / n
+    elif metric == "rmse":
+        return np.sqrt(errors["se"] / n)
+    elif metric == "mae":
+        return errors["ae"] / n
+    else:
+        return errors["ape"] / n
+
+def prune_candidates(scores, tolerance):
+    """Candidates whose score is more than tolerance worse than the best."""
+    best = min(scores.values())
+    return [
+        candidate for candidate, value in scores.items()
+        if value > best * (1 + tolerance)
+    ]
@@ -0,0 +1,46 @@
+"""Time and allocations of building the per-column frames of a wide input.
+
+Run from the repository root:
+    python -m tests.benchmarks.bench_data_builder
+"""
+import tracemalloc
+from multi_prophet import data_builder
+from tests.benchmarks.common import timed, synthetic_df, columns, print_table
+
+N_COLUMNS = 1000
+N_ROWS = 365 * 3
+N_REGRESSORS = 5
+
+
+def build_each(builder, df, names):
+    return [builder.create_df(df, c, train=True) for c in names]
+
+def build_shared(builder, df, names):
+    return [mdf for _, mdf in builder.create_dfs(df, names, train=True)]
+
+def peak_allocations(func, *args):
+    tracemalloc.start()
+    result = func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return peak
+
+def main():
+    df = synthetic_df(N_COLUMNS, n_rows=N_ROWS, n_regressors=N_REGRESSORS)
+    df["ds"] = df["ds"].dt.strftime("%Y-%m-%d")
+    names = columns(N_COLUMNS)
+    regressors = [f"r{i}" for i in range(N_REGRESSORS)]
+    builder = data_builder.DataFrameBuilder({c: regressors for c in names})
+
+    rows = []
+    for name, func in [("create_df", build_each), ("create_dfs", build_shared)]:
+        elapsed, _ = timed(func, builder, df, names, repeat=3)
+        peak = peak_allocations(func, builder, df, names)
+        rows.append((name, elapsed, peak / 2 ** 20))
+
+    print_table(["builder", "seconds", "peak_mib"], rows)
+
+
+if __name__ == "__main__":
+    main()
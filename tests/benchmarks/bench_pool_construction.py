@@ -0,0 +1,26 @@
+"""Pool construction time as the number of columns grows.
+
+Run from the repository root:
+    python -m tests.benchmarks.bench_pool_construction
+"""
+import prophet
+from multi_prophet import model_pool_factory
+from tests.benchmarks.common import timed, columns, print_table
+
+COLUMN_COUNTS = [10, 100, 1000, 2000]
+
+
+def main():
+    rows = []
+    for n in COLUMN_COUNTS:
+        elapsed, _ = timed(model_pool_factory, columns=columns(n))
+        rows.append((n, elapsed, elapsed / n))
+
+    print_table(["columns", "seconds", "seconds_per_column"], rows)
+
+    elapsed, _ = timed(lambda: [prophet.Prophet() for _ in range(10)])
+    print(f"\nprophet.Prophet construction: {elapsed / 10:.6f} seconds per model")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+"""Time and peak memory of MultiProphet operations over a grid of sizes.
+
+Each case varies the number of columns, the series length or the number of
+regressors of a synthetic wide frame, and two cases use the datasets in
+tests/data. Pool construction, fit, predict, cross_validation and
+performance_metrics are timed first, then run again under tracemalloc for
+their peak memory. The process-wide feature cache is cleared before every run,
+so results do not depend on earlier operations or cases.
+
+Run from the repository root:
+    python -m tests.benchmarks.bench_scaling --save baseline.json
+    python -m tests.benchmarks.bench_scaling --compare baseline.json
+"""
+import argparse
+import logging
+import sys
+import multi_prophet
+from multi_prophet import MultiProphet, model_pool_factory
+from tests.benchmarks.common import (timed, peak_memory, synthetic_df, dataset_df,
+                                     columns, print_table, save_baseline,
+                                     load_baseline, compare)
+
+BASE = {"columns": 4, "rows": 365, "regressors": 0}
+GRID = {
+    "columns": [1, 4, 16],
+    "rows": [365, 365 * 4],
+    "regressors": [0, 8],
+}
+QUICK_BASE = {"columns": 2, "rows": 365, "regressors": 0}
+QUICK_GRID = {
+    "columns": [1, 2],
+    "rows": [365],
+    "regressors": [0, 2],
+}
+DATASET_CASES = [
+    {"dataset": "peyton_manning", "columns": 2, "horizon": "365 days",
+     "period": "730 days", "initial": "1095 days", "periods": 365, "freq": "D"},
+    {"dataset": "retail_sales", "columns": 8, "horizon": "730 days",
+     "period": "1460 days", "initial": "3650 days", "periods": 24, "freq": "MS"},
+]
+SYNTHETIC_CV = {"horizon": "30 days", "period": "90 days", "initial": "180 days"}
+
+KEYS = ["case", "operation", "columns", "rows", "regressors"]
+METRICS = ["seconds", "peak_memory"]
+
+
+def synthetic_cases(base, grid):
+    cases = []
+    for axis, values in grid.items():
+        for value in values:
+            case = {**base, axis: value, "case": "synthetic"}
+            if case not in cases:
+                cases.append(case)
+
+    for case in cases:
+        case.update(SYNTHETIC_CV, periods=30, freq="D")
+        case["df"] = synthetic_df(case["columns"],
+                                  n_rows=case["rows"],
+                                  n_regressors=case["regressors"])
+    return cases
+
+def dataset_cases():
+    cases = []
+    for case in DATASET_CASES:
+        df = dataset_df(case["dataset"], n_columns=case["columns"])
+        cases.append({**case, "case": case["dataset"], "rows": len(df),
+                      "regressors": 0, "df": df})
+    return cases
+
+def operations(case):
+    names = columns(case["columns"])
+    regressors = [f"r{i}" for i in range(case["regressors"])]
+    state = {}
+
+    def pool():
+        return model_pool_factory(columns=names)
+
+    def fit():
+        mp = MultiProphet(columns=names)
+        for name in regressors:
+            mp.add_regressor(name)
+        state["mp"] = mp
+        return mp.fit(case["df"])
+
+    def predict():
+        mp = state["mp"]
+        future = mp.make_future_dataframe(case["periods"], freq=case["freq"])
+        for name in regressors:
+            future[name] = 0.0
+        return mp.predict(future)
+
+    def cross_validation():
+        mp = state["mp"]
+        # drops cached results so that every run computes them
+        for model in mp.model_pool.values():
+            model.cv_cache.clear()
+        state["cv"] = mp.cross_validation(case["horizon"],
+                                          period=case["period"],
+                                          initial=case["initial"])
+        return state["cv"]
+
+    def performance_metrics():
+        return state["mp"].performance_metrics(case["horizon"], cv_dfs=state["cv"])
+
+    return [pool, fit, predict, cross_validation, performance_metrics]
+
+def run_case(case, memory=True):
+    results = {}
+    for operation in operations(case):
+        multi_prophet.feature_cache.clear()
+        seconds, _ = timed(operation)
+        results[operation.__name__] = {"seconds": seconds, "peak_memory": None}
+
+    if memory:
+        for operation in operations(case):
+            multi_prophet.feature_cache.clear()
+            peak, _ = peak_memory(operation)
+            results[operation.__name__]["peak_memory"] = peak
+
+    return [
+        {
+            "case": case["case"],
+            "operation": name,
+            "columns": case["columns"],
+            "rows": case["rows"],
+            "regressors": case["regressors"],
+            **values,
+        }
+        for name, values in results.items()
+    ]
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true",
+                        help="small grid, without the tests/data datasets")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="skip the tracemalloc runs")
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative slowdown or growth (default 0.2)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    logging.getLogger("prophet").setLevel(logging.WARNING)
+
+    if args.quick:
+        cases = synthetic_cases(QUICK_BASE, QUICK_GRID)
+    else:
+        cases = synthetic_cases(BASE, GRID) + dataset_cases()
+
+    # loads the Stan model once, so that it is not timed with the first case
+    model_pool_factory(columns=columns(1))
+
+    results = []
+    for case in cases:
+        results.extend(run_case(case, memory=not args.no_memory))
+
+    print_table(KEYS + METRICS, [[r[k] for k in KEYS + METRICS] for r in results])
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    if args.compare:
+        rows = compare(results, load_baseline(args.compare), KEYS, METRICS)
+        regressions = [row for row in rows if row[-1] > 1 + args.tolerance]
+
+        print()
+        print_table(["key", "metric", "baseline", "current", "ratio"], rows)
+        if regressions:
+            print(f"\n{len(regressions)} regressions above {args.tolerance:.0%}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,92 @@
+"""Time and imported module count of python -c "import multi_prophet".
+
+Every case runs in a fresh interpreter. The import itself is timed inside the
+interpreter, the whole process from the outside, and the modules loaded by the
+import are counted. The first model case also builds a model, which imports
+prophet and its Stan backend.
+
+Run from the repository root:
+    python -m tests.benchmarks.bench_startup --save baseline.json
+    python -m tests.benchmarks.bench_startup --compare baseline.json
+"""
+import argparse
+import json
+import subprocess
+import sys
+import time
+from tests.benchmarks.common import print_table, save_baseline, load_baseline, compare
+
+# modules that the import alone should not load
+DEFERRED = ["prophet", "cmdstanpy", "matplotlib", "plotly"]
+CASES = {
+    "import": "import multi_prophet",
+    "first_model": "import multi_prophet\nmulti_prophet.Prophet()",
+}
+SCRIPT = """
+import json, sys, time
+before = set(sys.modules)
+start = time.perf_counter()
+{code}
+seconds = time.perf_counter() - start
+print(json.dumps({{
+    "seconds": seconds,
+    "modules": len(set(sys.modules) - before),
+    "deferred": [m for m in {deferred!r} if m in sys.modules],
+}}))
+"""
+
+KEYS = ["case"]
+METRICS = ["seconds", "process_seconds", "modules"]
+
+
+def run_case(name, code, repeat):
+    script = SCRIPT.format(code=code, deferred=DEFERRED)
+
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        output = subprocess.run([sys.executable, "-c", script], check=True,
+                                capture_output=True, text=True).stdout
+        result = json.loads(output.splitlines()[-1])
+        result["process_seconds"] = time.perf_counter() - start
+
+        if best is None or result["seconds"] < best["seconds"]:
+            best = result
+
+    return {"case": name, **best, "deferred": ",".join(best["deferred"]) or "-"}
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="interpreters per case, the fastest is kept (default 5)")
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare with a baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative slowdown or growth (default 0.2)")
+    return parser.parse_args(argv)
+
+def main(argv=None):
+    args = parse_args(argv)
+    results = [run_case(name, code, args.repeat) for name, code in CASES.items()]
+
+    header = KEYS + METRICS + ["deferred"]
+    print_table(header, [[r[k] for k in header] for r in results])
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    if args.compare:
+        rows = compare(results, load_baseline(args.compare), KEYS, METRICS)
+        regressions = [row for row in rows if row[-1] > 1 + args.tolerance]
+
+        print()
+        print_table(["key", "metric", "baseline", "current", "ratio"], rows)
+        if regressions:
+            print(f"\n{len(regressions)} regressions above {args.tolerance:.0%}")
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+import json
+import platform
+import time
+import tracemalloc
+import numpy as np
+import pandas as pd
+
+DATASETS = {
+    "peyton_manning": "tests/data/example_wp_log_peyton_manning.csv",
+    "retail_sales": "tests/data/retail_sales.csv",
+}
+
+
+def timed(func, *args, repeat=1, **kwargs):
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    return best, result
+
+def synthetic_df(n_columns, n_rows=365, n_regressors=0, seed=0):
+    rng = np.random.default_rng(seed)
+    t = np.arange(n_rows)
+
+    data = {"ds": pd.date_range("2020-01-01", periods=n_rows, freq="D")}
+    for i in range(n_columns):
+        data[f"y{i}"] = (
+            10 + 0.01 * t + np.sin(2 * np.pi * t / 7) + rng.normal(0, 0.1, n_rows)
+        )
+    for i in range(n_regressors):
+        data[f"r{i}"] = rng.normal(0, 1, n_rows)
+
+    return pd.DataFrame(data)
+
+def dataset_df(name, n_columns=1, n_regressors=0, seed=0):
+    """Wide frame with n_columns noisy copies of the y column of a dataset."""
+    df = pd.read_csv(DATASETS[name], parse_dates=["ds"])
+    rng = np.random.default_rng(seed)
+    scale = df["y"].std() * 0.05
+
+    data = {"ds": df["ds"]}
+    for i in range(n_columns):
+        data[f"y{i}"] = df["y"] + rng.normal(0, scale, len(df))
+    for i in range(n_regressors):
+        data[f"r{i}"] = rng.normal(0, 1, len(df))
+
+    return pd.DataFrame(data)
+
+def peak_memory(func, *args, **kwargs):
+    """Peak bytes allocated while running func, traced with tracemalloc."""
+    tracemalloc.start()
+    try:
+        result = func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak, result
+
+def columns(n_columns):
+    return [f"y{i}" for i in range(n_columns)]
+
+def print_table(header, rows):
+    print("\t".join(header))
+    for row in rows:
+        print("\t".join(
+            f"{value:.6f}" if isinstance(value, float) else str(value)
+            for value in row
+        ))
+
+def environment():
+    import multi_prophet
+    import prophet
+
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "multi_prophet": multi_prophet.__version__,
+        "prophet": prophet.__version__,
+        "pandas": pd.__version__,
+        "numpy": np.__version__,
+    }
+
+def save_baseline(path, results):
+    with open(path, "w") as f:
+        json.dump({"environment": environment(), "results": results}, f, indent=2)
+
+def load_baseline(path):
+    with open(path) as f:
+        return json.load(f)
+
+def compare(results, baseline, keys, metrics, tolerance=0.2):
+    """Rows of (key, metric, baseline, current, ratio) for matching results.
+
+    A ratio above 1 + tolerance is a regression.
+    """
+    previous = {tuple(r[k] for k in keys): r for r in baseline["results"]}
+
+    rows = []
+    for result in results:
+        key = tuple(result[k] for k in keys)
+        if key not in previous:
+            continue
+
+        for metric in metrics:
+            before, after = previous[key].get(metric), result.get(metric)
+            if before and after is not None:
+                rows.append((key, metric, before, after, after / before))
+
+    return rows
@@ -0,0 +1,115 @@
+import asyncio
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import multi_prophet
+from multi_prophet import aio, executors
+
+PREDICTOR_COLUMNS = ["y", "y1"]
+
+
+def _sleep(seconds, calls):
+    calls.append(seconds)
+    time.sleep(seconds)
+    return seconds
+
+def _run_all(n_tasks, calls, executor=None):
+    tasks = ((i, (0.05, calls)) for i in range(n_tasks))
+    return dict((c, r) for c, r, _ in executors.run_tasks(_sleep, tasks, executor))
+
+
+class AioTestCase(unittest.TestCase):
+    def test_run_cancellable(self):
+        calls = []
+        result = asyncio.run(aio.run_cancellable(_run_all, 3, calls))
+
+        self.assertEqual({0: 0.05, 1: 0.05, 2: 0.05}, result)
+
+    def test_cancel_serial(self):
+        calls = []
+
+        async def cancel():
+            task = asyncio.ensure_future(aio.run_cancellable(_run_all, 100, calls))
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(cancel())
+        time.sleep(0.2)
+        started = len(calls)
+        time.sleep(0.2)
+
+        self.assertLess(started, 100)
+        self.assertEqual(started, len(calls))
+
+    def test_cancel_parallel(self):
+        calls = []
+
+        async def cancel(pool):
+            task = asyncio.ensure_future(
+                aio.run_cancellable(_run_all, 100, calls, executor=pool)
+            )
+            await asyncio.sleep(0.2)
+            task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            asyncio.run(cancel(pool))
+
+        self.assertLess(len(calls), 100)
+
+    def test_create_executor(self):
+        executor = executors.create_executor("thread", 2)
+        self.assertIsInstance(executor, ThreadPoolExecutor)
+        executor.shutdown()
+
+        with self.assertRaises(ValueError):
+            executors.create_executor("invalid")
+
+
+class AsyncMultiProphetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        self.df["y1"] = self.df["y"]
+
+    def test_run_with_executor_without_cancel_futures(self):
+        shutdowns = []
+
+        class Executor(ThreadPoolExecutor):
+            # shutdown as in Python 3.8
+            def shutdown(self, wait=True):
+                shutdowns.append(wait)
+                super().shutdown(wait)
+
+        executors.register_backend("py38", Executor)
+        try:
+            result = asyncio.run(aio.run_with_executor(
+                lambda executor: executors.max_workers(executor),
+                max_concurrency=2,
+                backend="py38"
+            ))
+        finally:
+            del executors.BACKENDS["py38"]
+
+        self.assertEqual(2, result)
+        self.assertEqual([False], shutdowns)
+
+    def test_afit_apredict(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS,
+                                        uncertainty_samples=0)
+
+        async def run():
+            report = await mp.afit(self.df, max_concurrency=2)
+            future_df = mp.make_future_dataframe(7)
+            forecasts = await mp.apredict(future_df, columns=["y1"])
+            return report, future_df, forecasts
+
+        report, future_df, forecasts = asyncio.run(run())
+
+        self.assertCountEqual(PREDICTOR_COLUMNS, report.fitted)
+        self.assertEqual(["y1"], list(forecasts.keys()))
+        pd.testing.assert_frame_equal(mp.predict(future_df, columns=["y1"])["y1"],
+                                      forecasts["y1"])
@@ -0,0 +1,59 @@
+import unittest
+from multi_prophet import caching
+
+
+class LRUCacheTestCase(unittest.TestCase):
+    def test_get_put(self):
+        cache = caching.LRUCache(maxsize=2)
+        cache.put("a", 1)
+
+        self.assertEqual(1, cache.get("a"))
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual({"hits": 1, "misses": 1, "size": 1, "maxsize": 2},
+                         cache.info())
+
+    def test_evicts_least_recently_used(self):
+        cache = caching.LRUCache(maxsize=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        self.assertTrue("a" in cache)
+        self.assertFalse("b" in cache)
+        self.assertTrue("c" in cache)
+        self.assertEqual(2, len(cache))
+
+    def test_clear(self):
+        cache = caching.LRUCache()
+        cache.put("a", 1)
+        cache.get("a")
+        cache.clear()
+
+        self.assertEqual(0, len(cache))
+        self.assertEqual(0, cache.hits)
+
+    def test_maxbytes(self):
+        cache = caching.LRUCache(maxsize=None, maxbytes=10, sizeof=len)
+        cache.put("a", "xxxx")
+        cache.put("b", "xxxx")
+        cache.put("c", "xxxx")
+
+        self.assertFalse("a" in cache)
+        self.assertEqual(8, cache.bytes)
+        self.assertEqual(8, cache.info()["bytes"])
+
+        cache.put("b", "x")
+        self.assertEqual(5, cache.bytes)
+        self.assertEqual("x", cache.pop("b"))
+        self.assertEqual(4, cache.bytes)
+
+    def test_evict(self):
+        cache = caching.LRUCache()
+        cache.put(("y", 1), 1)
+        cache.put(("y1", 1), 2)
+        cache.put(("y", 2), 3)
+
+        cache.evict(lambda key: key[0] == "y")
+        self.assertEqual(1, len(cache))
+        self.assertTrue(("y1", 1) in cache)
@@ -88,3 +88,76 @@ class DataBuilderTestCase(unittest.TestCase):
 
         y1_df = df_builder.create_df(self.df, "y1")
         np.testing.assert_array_equal(["ds"], y1_df.columns)
+
+    def test_input_columns(self):
+        self.df["cap_y"] = 500
+        df_builder = data_builder.DataFrameBuilder({"y1": ["y"]})
+
+        self.assertEqual(
+            ["ds", "y", "cap_y", "y1"],
+            df_builder.input_columns(self.df, ["y", "y1"], train=True)
+        )
+        self.assertEqual(
+            ["ds", "cap_y", "y"],
+            df_builder.input_columns(self.df, ["y", "y1"])
+        )
+
+    def test_create_dfs(self):
+        self.df["cap_y"] = 500
+        df_builder = data_builder.DataFrameBuilder({"y": ["y1"]})
+
+        dfs = dict(df_builder.create_dfs(self.df, PREDICTOR_COLUMNS, train=True))
+
+        self.assertEqual(PREDICTOR_COLUMNS, list(dfs.keys()))
+        np.testing.assert_array_equal(["ds", "y", "cap", "y1"], dfs["y"].columns)
+        np.testing.assert_array_equal(["ds", "y"], dfs["y1"].columns)
+
+        for column in PREDICTOR_COLUMNS:
+            expected = df_builder.create_df(self.df, column, train=True)
+            expected["ds"] = pd.to_datetime(expected["ds"])
+            pd.testing.assert_frame_equal(expected, dfs[column])
+
+    def test_create_dfs_shares_arrays(self):
+        df_builder = data_builder.DataFrameBuilder({"y": ["y1"]})
+        arrays = data_builder.ColumnArrays(self.df)
+
+        y_df = df_builder.create_df(self.df, "y", arrays=arrays)
+        y1_df = df_builder.create_df(self.df, "y1", arrays=arrays)
+
+        self.assertIs(arrays["ds"], arrays["ds"])
+        self.assertFalse(arrays["ds"].flags.writeable)
+        self.assertTrue(np.shares_memory(arrays["ds"], y1_df["ds"].values))
+        self.assertTrue(np.shares_memory(y_df["ds"].values, y1_df["ds"].values))
+
+    def test_regressors_ignore_index(self):
+        self.df.index = self.df.index + 100
+        df_builder = data_builder.DataFrameBuilder({"y": ["y1"]})
+
+        y_df = df_builder.create_df(self.df, "y")
+        np.testing.assert_array_equal(self.df["y1"].values, y_df["y1"].values)
+
+    def test_create_series_df(self):
+        long_df = pd.DataFrame({
+            "ds": ["2020-01-01", "2020-01-01", "2020-01-02", "2020-01-02"],
+            "series": ["a", "b", "a", "b"],
+            "value": [1.0, 2.0, 3.0, 4.0],
+            "cap": [10.0, 20.0, 30.0, 40.0],
+            "r": [0.1, 0.2, 0.3, 0.4],
+        })
+        df_builder = data_builder.DataFrameBuilder({"b": ["r"]},
+                                                   id_column="series",
+                                                   value_column="value")
+
+        a_df = df_builder.create_series_df(long_df, "a", [0, 2], train=True)
+        b_df = df_builder.create_series_df(long_df, "b", [1, 3])
+
+        self.assertTrue(df_builder.is_long(long_df))
+        self.assertFalse(df_builder.is_long(self.df))
+        np.testing.assert_array_equal(["ds", "y", "cap"], a_df.columns)
+        np.testing.assert_array_equal([1.0, 3.0], a_df["y"].values)
+        np.testing.assert_array_equal(["ds", "cap", "r"], b_df.columns)
+        np.testing.assert_array_equal([0.2, 0.4], b_df["r"].values)
+        self.assertEqual(
+            ["ds", "value", "cap", "r"],
+            df_builder.input_columns(long_df, ["a", "b"], train=True)
+        )
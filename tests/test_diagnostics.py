@@ -0,0 +1,62 @@
+import unittest
+import pandas as pd
+import prophet
+from prophet.diagnostics import cross_validation
+from multi_prophet import diagnostics
+
+
+class DiagnosticsTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        cls.model = prophet.Prophet().fit(df)
+
+    def test_cv_key(self):
+        self.assertEqual(
+            diagnostics.cv_key("365 days", period="1000 days"),
+            diagnostics.cv_key("8760 hours", period=pd.Timedelta("1000 days"))
+        )
+        self.assertNotEqual(
+            diagnostics.cv_key("365 days"),
+            diagnostics.cv_key("365 days", initial="1000 days")
+        )
+
+    def test_cross_validation_plan(self):
+        plan = diagnostics.cross_validation_plan(self.model,
+                                                 "365 days",
+                                                 period="1000 days")
+
+        self.assertEqual(pd.Timedelta("365 days"), plan.horizon)
+        self.assertEqual(["ds", "yhat", "yhat_lower", "yhat_upper"],
+                         plan.predict_columns)
+        self.assertEqual(
+            [pd.Timestamp("2012-04-25"), pd.Timestamp("2015-01-20")],
+            plan.cutoffs
+        )
+
+    def test_cross_validation_plan_invalid_cutoffs(self):
+        with self.assertRaises(ValueError):
+            diagnostics.cross_validation_plan(self.model,
+                                              "365 days",
+                                              cutoffs=[pd.Timestamp("2016-01-01")])
+
+    def test_cross_validation_plan_unfitted_model(self):
+        with self.assertRaises(Exception):
+            diagnostics.cross_validation_plan(prophet.Prophet(), "365 days")
+
+    def test_cutoff_forecasts_match_cross_validation(self):
+        plan = diagnostics.cross_validation_plan(self.model,
+                                                 "365 days",
+                                                 period="1000 days")
+
+        cv_df = diagnostics.combine_cutoff_forecasts([
+            diagnostics.cutoff_forecast(self.model,
+                                        cutoff,
+                                        plan.horizon,
+                                        plan.predict_columns)
+            for cutoff in plan.cutoffs
+        ])
+
+        expected = cross_validation(self.model, "365 days", period="1000 days")
+        pd.testing.assert_frame_equal(expected[["ds", "yhat", "y", "cutoff"]],
+                                      cv_df[["ds", "yhat", "y", "cutoff"]])
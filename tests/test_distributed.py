@@ -0,0 +1,91 @@
+import pickle
+import socket
+import unittest
+import pandas as pd
+import multi_prophet
+from multi_prophet import distributed, executors
+
+PREDICTOR_COLUMNS = ["y", "y1"]
+
+
+def _square(x):
+    if x < 0:
+        raise ValueError("negative")
+    return x * x
+
+
+class DistributedTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.executor = distributed.SocketExecutor.loopback(max_workers=2)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+
+    def test_run_tasks(self):
+        tasks = [("a", (2,)), ("b", (-1,)), ("c", (4,))]
+        results = list(executors.run_tasks(_square, tasks, self.executor))
+
+        errors = {c: e for c, _, e in results if e is not None}
+        values = {c: r for c, r, e in results if e is None}
+
+        self.assertEqual({"a": 4, "c": 16}, values)
+        self.assertIsInstance(errors["b"], ValueError)
+        self.assertEqual(2, executors.max_workers(self.executor))
+
+    def test_multi_prophet(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        df["y1"] = df["y"]
+        df["r"] = 0.0
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.add_regressor("r", columns=["y"])
+
+        report = mp.fit(df, executor=self.executor)
+        future_df = mp.make_future_dataframe(7).assign(r=0.0)
+        forecasts = mp.predict(future_df, executor=self.executor)
+        expected = mp.predict(future_df)
+
+        self.assertCountEqual(PREDICTOR_COLUMNS, report.fitted)
+        for column in PREDICTOR_COLUMNS:
+            self.assertTrue(mp.model_pool[column].fitted)
+            pd.testing.assert_series_equal(expected[column]["yhat"],
+                                           forecasts[column]["yhat"])
+
+    def test_unpicklable_task(self):
+        executor = distributed.SocketExecutor.loopback(max_workers=1)
+        future = executor.submit(lambda: 1)
+        queued = executor.submit(abs, -3)
+
+        with self.assertRaises((pickle.PicklingError, AttributeError)):
+            future.result(timeout=10)
+        self.assertEqual(3, queued.result(timeout=10))
+        executor.shutdown()
+
+    def test_unreachable_worker(self):
+        with socket.create_server(("127.0.0.1", 0)) as server:
+            address = server.getsockname()
+        executor = distributed.SocketExecutor([address])
+
+        future = executor.submit(_square, 2)
+        with self.assertRaises(OSError):
+            future.result(timeout=10)
+        executor.shutdown()
+
+    def test_repeated_shutdown(self):
+        for _ in range(5):
+            executor = distributed.SocketExecutor.loopback(max_workers=2)
+            self.assertEqual(4, executor.submit(_square, 2).result())
+            executor.shutdown()
+
+            # workers exit on the stop message instead of being terminated
+            self.assertEqual([0, 0], [p.exitcode for p in executor.processes])
+
+    def test_shutdown_stops_workers(self):
+        executor = distributed.SocketExecutor.loopback(max_workers=1)
+        self.assertEqual(9, executor.submit(_square, 3).result())
+        executor.shutdown()
+
+        self.assertEqual([0], [p.exitcode for p in executor.processes])
+        with self.assertRaises(RuntimeError):
+            executor.submit(_square, 3)
@@ -0,0 +1,108 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from multi_prophet import executors
+
+
+def _square(x):
+    if x < 0:
+        raise ValueError("negative")
+    return x * x
+
+
+class ExecutorsTestCase(unittest.TestCase):
+    def test_resolve_serial(self):
+        executor, owned = executors.resolve_executor()
+        self.assertIsNone(executor)
+        self.assertFalse(owned)
+
+        executor, owned = executors.resolve_executor(n_jobs=1)
+        self.assertIsNone(executor)
+
+    def test_resolve_given_executor(self):
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            executor, owned = executors.resolve_executor(executor=pool, n_jobs=4)
+            self.assertIs(pool, executor)
+            self.assertFalse(owned)
+
+    def test_run_tasks_serial(self):
+        tasks = [("a", (2,)), ("b", (3,))]
+        results = list(executors.run_tasks(_square, tasks))
+
+        self.assertEqual([("a", 4, None), ("b", 9, None)], results)
+
+    def test_run_tasks_parallel(self):
+        tasks = [("a", (2,)), ("b", (3,)), ("c", (4,))]
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = {
+                c: r for c, r, _ in executors.run_tasks(_square, tasks, executor=pool)
+            }
+
+        self.assertEqual({"a": 4, "b": 9, "c": 16}, results)
+
+    def test_run_tasks_errors_per_column(self):
+        tasks = [("a", (2,)), ("b", (-1,)), ("c", (4,))]
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = list(executors.run_tasks(_square, tasks, executor=pool))
+
+        errors = {c: e for c, _, e in results if e is not None}
+        values = {c: r for c, r, e in results if e is None}
+
+        self.assertEqual(["b"], list(errors.keys()))
+        self.assertIsInstance(errors["b"], ValueError)
+        self.assertEqual({"a": 4, "c": 16}, values)
+
+    def test_run_tasks_max_pending(self):
+        submitted = []
+
+        def tasks():
+            for i in range(5):
+                submitted.append(i)
+                yield "c%d" % i, (i,)
+
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            results = executors.run_tasks(_square, tasks(), executor=pool, max_pending=2)
+            first = next(results)
+
+            self.assertEqual([0, 1], submitted)
+            values = {c: r for c, r, _ in [first, *results]}
+
+        self.assertEqual({"c0": 0, "c1": 1, "c2": 4, "c3": 9, "c4": 16}, values)
+
+    def test_serial_executor(self):
+        tasks = [("a", (2,)), ("b", (-1,))]
+        executor = executors.create_executor("serial")
+        results = list(executors.run_tasks(_square, tasks, executor))
+
+        self.assertEqual(("a", 4, None), results[0])
+        self.assertIsInstance(results[1][2], ValueError)
+        self.assertEqual(9, executor.submit(_square, 3).result())
+        self.assertEqual(1, executors.max_workers(executor))
+
+    def test_resolve_backend_name(self):
+        executor, owned = executors.resolve_executor("thread", n_jobs=3)
+        executor.shutdown()
+
+        self.assertIsInstance(executor, ThreadPoolExecutor)
+        self.assertEqual(3, executors.max_workers(executor))
+        self.assertTrue(owned)
+
+        with self.assertRaises(ValueError):
+            executors.resolve_executor("cluster")
+
+    def test_register_backend(self):
+        executors.register_backend("test", lambda max_workers=None: "executor")
+        try:
+            self.assertEqual("executor", executors.create_executor("test"))
+        finally:
+            del executors.BACKENDS["test"]
+
+    def test_remote_executor(self):
+        self.assertFalse(executors.is_remote_executor(None))
+        self.assertFalse(executors.is_process_executor(executors.SerialExecutor()))
+
+        executor = executors.SerialExecutor()
+        executor.remote = True
+        self.assertTrue(executors.is_remote_executor(executor))
+        self.assertTrue(executors.is_process_executor(executor))
@@ -0,0 +1,40 @@
+import unittest
+import pandas as pd
+import multi_prophet
+from multi_prophet import fingerprints
+
+
+class FingerprintsTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        self.model = multi_prophet.Prophet()
+
+    def test_same_input(self):
+        self.assertEqual(
+            fingerprints.fit_fingerprint(self.df, self.model, {}),
+            fingerprints.fit_fingerprint(self.df.copy(), self.model, {})
+        )
+
+    def test_changed_data(self):
+        changed = self.df.copy()
+        changed.loc[10, "y"] += 1
+
+        self.assertNotEqual(
+            fingerprints.fit_fingerprint(self.df, self.model, {}),
+            fingerprints.fit_fingerprint(changed, self.model, {})
+        )
+
+    def test_changed_config(self):
+        before = fingerprints.fit_fingerprint(self.df, self.model, {})
+        self.model.add_seasonality(name="monthly", period=30.5, fourier_order=5)
+
+        self.assertNotEqual(
+            before,
+            fingerprints.fit_fingerprint(self.df, self.model, {})
+        )
+
+    def test_changed_fit_kwargs(self):
+        self.assertNotEqual(
+            fingerprints.fit_fingerprint(self.df, self.model, {}),
+            fingerprints.fit_fingerprint(self.df, self.model, {"algorithm": "Newton"})
+        )
@@ -0,0 +1,223 @@
+import pickle
+import unittest
+from unittest import mock
+import numpy as np
+import pandas as pd
+import prophet
+from multi_prophet import forecaster
+
+
+class ForecasterTestCase(unittest.TestCase):
+    def test_backend_model_is_shared(self):
+        m1 = forecaster.CachedProphet()
+        m2 = forecaster.CachedProphet()
+
+        self.assertIsNot(m1.stan_backend, m2.stan_backend)
+        self.assertIs(m1.stan_backend.model, m2.stan_backend.model)
+
+    def test_backend_cached_by_type(self):
+        m = forecaster.CachedProphet()
+        backend = forecaster.load_stan_backend(m.stan_backend.get_type())
+
+        self.assertIs(m.stan_backend.model, backend.model)
+
+    def test_pickle_without_backend(self):
+        m = forecaster.CachedProphet()
+        state = m.__getstate__()
+        self.assertEqual(m.stan_backend.get_type(), state["stan_backend"])
+
+        m2 = pickle.loads(pickle.dumps(m))
+        self.assertIs(m.stan_backend.model, m2.stan_backend.model)
+
+    def test_fit_predict(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+
+        m = forecaster.CachedProphet().fit(df)
+        expected = prophet.Prophet().fit(df)
+
+        future_df = m.make_future_dataframe(7)
+        pd.testing.assert_series_equal(
+            expected.predict(future_df)["yhat"],
+            m.predict(future_df)["yhat"]
+        )
+
+    def test_warm_start_init(self):
+        stan_init = {
+            "k": 0.1, "m": 0.2, "delta": np.zeros(3), "beta": np.zeros(2),
+            "sigma_obs": 1
+        }
+        params = {
+            "k": np.array([[0.5]]),
+            "m": np.array([[0.6]]),
+            "delta": np.array([[0.1, 0.2, 0.3]]),
+            "beta": np.array([[0.1, 0.2, 0.3]]),
+            "sigma_obs": np.array([[0.05]]),
+        }
+
+        init = forecaster.warm_start_init(stan_init, params)
+
+        self.assertEqual(0.5, init["k"])
+        self.assertEqual(0.6, init["m"])
+        np.testing.assert_array_equal([0.1, 0.2, 0.3], init["delta"])
+        np.testing.assert_array_equal([0, 0], init["beta"])
+        self.assertEqual(0.05, init["sigma_obs"])
+
+    def test_warm_start_fit(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+
+        cold = forecaster.CachedProphet().fit(df)
+        warm = forecaster.CachedProphet().fit(df, init_params=cold.params)
+
+        if forecaster.reports_iterations():
+            self.assertLess(warm.optimizer_iterations, cold.optimizer_iterations)
+        np.testing.assert_allclose(cold.params["k"], warm.params["k"], rtol=1e-2)
+
+    def test_feature_cache_shared_between_models(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        forecaster.feature_cache.clear()
+
+        m1 = forecaster.CachedProphet().fit(df)
+        misses = forecaster.feature_cache.misses
+
+        df["y"] = df["y"] * 2
+        m2 = forecaster.CachedProphet().fit(df)
+
+        self.assertEqual(misses, forecaster.feature_cache.misses)
+        self.assertGreater(forecaster.feature_cache.hits, 0)
+
+        future_df = m1.make_future_dataframe(7)
+        m1.predict(future_df)
+        hits = forecaster.feature_cache.hits
+        m2.predict(future_df)
+        self.assertGreater(forecaster.feature_cache.hits, hits)
+
+    def test_feature_cache_bytes(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        forecaster.feature_cache.clear()
+
+        forecaster.CachedProphet().fit(df)
+        info = forecaster.feature_cache.info()
+
+        self.assertEqual(forecaster.FEATURE_CACHE_BYTES, info["maxbytes"])
+        self.assertGreater(info["bytes"], 0)
+        self.assertLessEqual(info["bytes"], info["maxbytes"])
+
+    def test_feature_cache_matches_prophet(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        forecaster.feature_cache.clear()
+
+        m1 = forecaster.CachedProphet()
+        m1.add_country_holidays("US")
+        m1.fit(df)
+
+        m2 = forecaster.CachedProphet()
+        m2.add_country_holidays("US")
+        m2.fit(df)
+
+        expected = prophet.Prophet()
+        expected.add_country_holidays("US")
+        expected.fit(df)
+
+        pd.testing.assert_series_equal(expected.train_holiday_names,
+                                       m2.train_holiday_names)
+
+        future_df = m2.make_future_dataframe(7)
+        pd.testing.assert_series_equal(expected.predict(future_df)["yhat"],
+                                       m2.predict(future_df)["yhat"])
+
+    def test_feature_cache_key(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        df["ds"] = pd.to_datetime(df["ds"])
+        m1 = forecaster.CachedProphet()
+        m2 = forecaster.CachedProphet()
+
+        self.assertEqual(m1._feature_key(df), m2._feature_key(df))
+
+        m2.add_seasonality(name="monthly", period=30.5, fourier_order=5)
+        self.assertNotEqual(m1._feature_key(df), m2._feature_key(df))
+        self.assertNotEqual(m1._feature_key(df), m1._feature_key(df.head(-1)))
+
+    def test_holiday_table_shared_between_models(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        forecaster.feature_cache.clear()
+
+        m1 = forecaster.CachedProphet()
+        m1.add_country_holidays("US")
+        m1.fit(df)
+
+        m2 = forecaster.CachedProphet(weekly_seasonality=False)
+        m2.add_country_holidays("US")
+        m2.fit(df)
+
+        self.assertIs(m1.holiday_tables["US"], m2.holiday_tables["US"])
+        self.assertEqual("US", m2.country_holidays)
+        self.assertIsNone(m2.holidays)
+
+        expected = prophet.Prophet(weekly_seasonality=False)
+        expected.add_country_holidays("US")
+        expected.fit(df)
+
+        future_df = m2.make_future_dataframe(7)
+        pd.testing.assert_series_equal(expected.predict(future_df)["yhat"],
+                                       m2.predict(future_df)["yhat"])
+
+    def test_holiday_table_with_custom_holidays(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        holidays = pd.DataFrame({
+            "holiday": "playoff",
+            "ds": pd.to_datetime(["2010-01-24", "2014-01-19"]),
+        })
+
+        m = forecaster.CachedProphet(holidays=holidays)
+        m.add_country_holidays("US")
+        m.fit(df)
+
+        expected = prophet.Prophet(holidays=holidays)
+        expected.add_country_holidays("US")
+        expected.fit(df)
+
+        self.assertEqual(list(expected.train_holiday_names),
+                         list(m.train_holiday_names))
+        self.assertIs(holidays, m.holidays)
+
+    @unittest.skipUnless(forecaster.reports_iterations(),
+                         "the Stan backend does not report iterations")
+    def test_optimizer_iterations_without_saved_iterates(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        m = forecaster.CachedProphet()
+        model = m.stan_backend.model
+
+        with mock.patch.object(model, "optimize", wraps=model.optimize) as optimize:
+            m.fit(df)
+
+        self.assertNotIn("save_iterations", optimize.call_args.kwargs)
+        self.assertGreater(m.optimizer_iterations, 1)
+
+        # Newton, used for short histories, reports iterations differently
+        short = forecaster.CachedProphet().fit(df.head(60))
+        self.assertGreater(short.optimizer_iterations, 1)
+
+    def test_optimizer_iterations_unavailable(self):
+        # pystan 2 fits are the optimal params only
+        self.assertIsNone(forecaster._optimizer_iterations({"k": 0.1, "m": 0.2}))
+        self.assertIsNone(forecaster._optimizer_iterations(None))
+
+    def test_compact(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        m = forecaster.CachedProphet().fit(df)
+
+        future_df = m.make_future_dataframe(7)
+        expected = m.predict(future_df)
+        before = forecaster.model_size(m)
+
+        m.compact()
+
+        self.assertEqual(2, len(m.history))
+        self.assertEqual(set(forecaster.STAN_PARAMS), set(m.params.keys()))
+        self.assertIsNone(m.stan_fit)
+        self.assertLess(forecaster.model_size(m), before / 5)
+
+        pd.testing.assert_frame_equal(future_df, m.make_future_dataframe(7))
+        forecast = m.predict(future_df)
+        for column in ["ds", "trend", "yhat", "weekly", "yearly"]:
+            pd.testing.assert_series_equal(expected[column], forecast[column])
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+import pandas as pd
+from multi_prophet import forecasts
+
+
+class ForecastsTestCase(unittest.TestCase):
+    def setUp(self):
+        ds = pd.date_range("2020-01-01", periods=3)
+        self.forecasts = {
+            column: pd.DataFrame({
+                "ds": ds,
+                "trend": np.arange(3.0),
+                "yhat": np.arange(3.0) + i,
+                "yhat_lower": np.arange(3.0) + i - 1,
+                "yhat_upper": np.arange(3.0) + i + 1,
+            })
+            for i, column in enumerate(["y1", "y2"])
+        }
+
+    def test_trim_forecast(self):
+        forecast = forecasts.trim_forecast(self.forecasts["y1"], dtype="float32")
+
+        self.assertEqual(["ds", "yhat", "yhat_lower", "yhat_upper"],
+                         list(forecast.columns))
+        self.assertEqual(np.float32, forecast["yhat"].dtype)
+
+    def test_long_layout(self):
+        df = forecasts.combine_forecasts(self.forecasts, components=["yhat"])
+
+        self.assertEqual(["ds", "column", "yhat"], list(df.columns))
+        self.assertEqual(6, len(df))
+        self.assertEqual(["y1", "y2"], list(df["column"].cat.categories))
+        np.testing.assert_array_equal([1, 2, 3],
+                                      df[df["column"] == "y2"]["yhat"].values)
+
+    def test_wide_layout(self):
+        df = forecasts.combine_forecasts(self.forecasts, layout="wide", dtype="float32")
+
+        self.assertEqual(3, len(df))
+        self.assertEqual("ds", df.index.name)
+        self.assertEqual(("y1", "yhat"), df.columns[0])
+        self.assertEqual(6, len(df.columns))
+        np.testing.assert_array_equal([2, 3, 4], df[("y2", "yhat_upper")].values)
+        self.assertEqual(np.float32, df[("y2", "yhat")].dtype)
+
+    def test_invalid_layout(self):
+        with self.assertRaises(ValueError):
+            forecasts.combine_forecasts(self.forecasts, layout="invalid")
@@ -0,0 +1,28 @@
+import gc
+import unittest
+import pandas as pd
+from prophet.make_holidays import make_holidays_df
+from multi_prophet import holiday_tables
+
+
+class HolidayTablesTestCase(unittest.TestCase):
+    def test_table(self):
+        table = holiday_tables.country_holidays_df("US", [2016, 2015])
+        expected = make_holidays_df(year_list=[2015, 2016], country="US")
+
+        pd.testing.assert_frame_equal(expected, table)
+
+    def test_table_shared(self):
+        table = holiday_tables.country_holidays_df("US", [2015, 2016])
+
+        self.assertIs(table, holiday_tables.country_holidays_df("US", [2016, 2015]))
+        self.assertTrue(("US", (2015, 2016)) in holiday_tables.cached_tables())
+        self.assertIsNot(table, holiday_tables.country_holidays_df("US", [2015]))
+
+    def test_table_evicted_when_unused(self):
+        table = holiday_tables.country_holidays_df("FR", [2015])
+        self.assertTrue(("FR", (2015,)) in holiday_tables.cached_tables())
+
+        del table
+        gc.collect()
+        self.assertFalse(("FR", (2015,)) in holiday_tables.cached_tables())
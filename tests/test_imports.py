@@ -0,0 +1,26 @@
+import subprocess
+import sys
+import unittest
+
+SCRIPT = """
+import sys
+import multi_prophet
+print(",".join(m for m in ["prophet", "cmdstanpy", "matplotlib", "plotly"]
+               if m in sys.modules))
+"""
+
+
+class ImportsTestCase(unittest.TestCase):
+    def test_import_defers_prophet(self):
+        output = subprocess.run([sys.executable, "-c", SCRIPT], check=True,
+                                capture_output=True, text=True).stdout
+
+        self.assertEqual("", output.strip())
+
+    def test_feature_cache(self):
+        import multi_prophet
+        from multi_prophet import forecaster
+
+        self.assertIs(forecaster.feature_cache, multi_prophet.feature_cache)
+        with self.assertRaises(AttributeError):
+            multi_prophet.missing
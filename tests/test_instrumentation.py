@@ -0,0 +1,69 @@
+import json
+import time
+import unittest
+from multi_prophet import instrumentation
+
+
+def _task(value):
+    with instrumentation.span("build"):
+        with instrumentation.span("features"):
+            time.sleep(0.01)
+    instrumentation.annotate(iterations=value)
+    return value
+
+
+class InstrumentationTestCase(unittest.TestCase):
+    def test_span_disabled(self):
+        self.assertFalse(instrumentation.recording())
+        self.assertIs(instrumentation.span("fit"), instrumentation.span("predict"))
+        self.assertEqual(3, _task(3))
+
+    def test_recorder_excludes_nested_phases(self):
+        recorder = instrumentation.Recorder()
+
+        with recorder.span("fit"):
+            with recorder.span("optimize"):
+                time.sleep(0.02)
+
+        (inner, inner_seconds), (outer, outer_seconds) = recorder.phases
+        self.assertEqual(("optimize", "fit"), (inner, outer))
+        self.assertGreaterEqual(inner_seconds, 0.02)
+        self.assertLess(outer_seconds, inner_seconds)
+
+    def test_profiled(self):
+        result, profile = instrumentation.Profiled(_task)(3)
+
+        self.assertEqual(3, result)
+        self.assertEqual(["features", "build"], [p for p, _ in profile["phases"]])
+        self.assertEqual({"iterations": 3}, profile["notes"])
+        self.assertGreaterEqual(profile["seconds"], 0.01)
+        self.assertFalse(instrumentation.recording())
+
+    def test_record(self):
+        events = []
+        instr = instrumentation.Instrumentation(callbacks=[events.append])
+
+        _, profile = instrumentation.Profiled(_task)(3)
+        instr.record("fit", "y", profile)
+        _, profile = instrumentation.Profiled(_task)(5)
+        instr.record("cross_validation", ("y", "2012-01-01"), profile)
+        instr.record("tune", ("y", 0, "2013-01-01"), profile)
+
+        self.assertEqual(9, len(events))
+        self.assertEqual(events, instr.events)
+
+        df = instr.to_frame()
+        self.assertEqual(["features", "build", "task"] * 3, list(df["phase"]))
+        self.assertEqual(["2012-01-01"] * 3 + ["2013-01-01"] * 3,
+                         list(df["cutoff"].dropna()))
+
+        summary = instr.summary()
+        self.assertEqual(["build", "features", "total", "process_peak_memory",
+                          "iterations"],
+                         list(summary.columns))
+        self.assertEqual(3, summary.loc[("fit", "y"), "iterations"])
+
+        self.assertEqual(instr.events, json.loads(instr.to_json()))
+
+        instr.clear()
+        self.assertTrue(instr.summary().empty)
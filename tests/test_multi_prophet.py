@@ -1,8 +1,10 @@
 import unittest
+from unittest import mock
 import numpy as np
 import pandas as pd
 import matplotlib
 import multi_prophet
+from multi_prophet import forecaster
 
 
 PREDICTOR_COLUMNS = ["y", "y1"]
@@ -19,6 +21,143 @@ class MultiProphetTestCase(unittest.TestCase):
         mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
         self.assertIsNotNone(mp)
 
+    def test_fit_report(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        report = mp.fit(self.df)
+
+        self.assertEqual(PREDICTOR_COLUMNS, report.fitted)
+        self.assertEqual({}, report.errors)
+
+    def test_fit_skips_unchanged_columns(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+        y_model = mp.model_pool["y"].prophet
+
+        self.df.loc[0, "y1"] += 1
+        report = mp.fit(self.df)
+
+        self.assertEqual(["y1"], report.fitted)
+        self.assertEqual(["y"], report.reused)
+        self.assertIs(y_model, mp.model_pool["y"].prophet)
+
+    def test_fit_force(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+        report = mp.fit(self.df, force=True)
+
+        # columns are fitted in order of their learned runtimes
+        self.assertCountEqual(PREDICTOR_COLUMNS, report.fitted)
+        self.assertEqual([], report.reused)
+
+    def test_fit_slim(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        report = mp.fit(self.df, slim=True)
+
+        for column in PREDICTOR_COLUMNS:
+            memory = report.memory[column]
+            self.assertLess(memory["after"], memory["before"])
+            self.assertEqual(2, len(mp.model_pool[column].prophet.history))
+
+        future_df = mp.make_future_dataframe(7)
+        self.assertEqual(len(self.df) + 7, len(future_df))
+        self.assertEqual(len(future_df), len(mp.predict(future_df)["y"]))
+
+    def test_compact(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+
+        memory = mp.compact(columns=["y"])
+
+        self.assertEqual(["y"], list(memory.keys()))
+        self.assertLess(memory["y"]["after"], memory["y"]["before"])
+        self.assertEqual(len(self.df), len(mp.model_pool["y1"].prophet.history))
+
+    def test_fit_warm_start(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df.head(-7))
+        report = mp.fit(self.df, warm_start=True, n_jobs=2)
+
+        for column in PREDICTOR_COLUMNS:
+            if forecaster.reports_iterations():
+                self.assertGreater(report.iterations[column], 0)
+                self.assertGreater(report.iteration_delta[column], 0)
+            self.assertEqual(len(self.df), len(mp.model_pool[column].prophet.history))
+
+    def test_fit_parallel(self):
+        sequential = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        sequential.fit(self.df)
+
+        parallel = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        report = parallel.fit(self.df, n_jobs=2)
+
+        self.assertEqual(set(PREDICTOR_COLUMNS), set(report.fitted))
+
+        future_df = sequential.make_future_dataframe(7)
+        for column in PREDICTOR_COLUMNS:
+            np.testing.assert_allclose(
+                sequential.model_pool[column].prophet.params["k"],
+                parallel.model_pool[column].prophet.params["k"]
+            )
+
+        forecasts = parallel.predict(future_df)
+        self.assertEqual(len(future_df), len(forecasts["y"]))
+
+    def test_predict_parallel(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+        future_df = mp.make_future_dataframe(7)
+
+        sequential = mp.predict(future_df)
+        parallel = mp.predict(future_df, n_jobs=2)
+
+        self.assertEqual(PREDICTOR_COLUMNS, list(parallel.keys()))
+        for column in PREDICTOR_COLUMNS:
+            np.testing.assert_allclose(
+                sequential[column]["yhat"], parallel[column]["yhat"]
+            )
+
+    def test_fit_errors_per_column(self):
+        self.df["y2"] = np.nan
+        mp = multi_prophet.MultiProphet(columns=["y", "y2"])
+
+        with self.assertRaises(multi_prophet.FitError) as ctx:
+            mp.fit(self.df, n_jobs=2)
+
+        self.assertEqual(["y2"], list(ctx.exception.errors.keys()))
+        self.assertEqual(["y"], ctx.exception.report.fitted)
+        self.assertIsNotNone(mp.model_pool["y"].prophet.history)
+
+    def test_iter_fit_predict(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        future_df = self.df[["ds"]]
+
+        results = mp.iter_fit_predict(self.df, future_df)
+        column, forecast = next(results)
+
+        self.assertEqual("y", column)
+        self.assertEqual(len(future_df), len(forecast))
+        self.assertFalse(mp.model_pool["y1"].fitted)
+
+        self.assertEqual(["y1"], [c for c, _ in results])
+        self.assertTrue(mp.model_pool["y1"].fitted)
+
+    def test_iter_fit_predict_parallel(self):
+        self.df["y2"] = np.nan
+        mp = multi_prophet.MultiProphet(columns=["y", "y1", "y2"])
+        future_df = self.df[["ds"]]
+
+        forecasts = {}
+        with self.assertRaises(multi_prophet.FitError) as ctx:
+            for column, forecast in mp.iter_fit_predict(self.df,
+                                                        future_df,
+                                                        max_pending=1,
+                                                        n_jobs=2):
+                forecasts[column] = forecast
+
+        self.assertEqual(["y", "y1"], sorted(forecasts.keys()))
+        self.assertEqual(["y2"], list(ctx.exception.errors.keys()))
+        np.testing.assert_allclose(forecasts["y"]["yhat"], forecasts["y1"]["yhat"])
+
     def test_make_future_dataframe_length(self):
         mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
         mp.fit(self.df)
@@ -56,6 +195,123 @@ class MultiProphetTestCase(unittest.TestCase):
         self.assertIsInstance(forecast["y"], pd.DataFrame)
         self.assertIsInstance(forecast["y1"], pd.DataFrame)
 
+    def test_predict_long_output(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+        future_df = mp.make_future_dataframe(7)
+
+        forecast = mp.predict(future_df, output="long", dtype="float32")
+
+        self.assertEqual(["ds", "column", "yhat", "yhat_lower", "yhat_upper"],
+                         list(forecast.columns))
+        self.assertEqual(2 * len(future_df), len(forecast))
+        self.assertEqual(np.float32, forecast["yhat"].dtype)
+
+    def test_predict_wide_point_output(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+        future_df = mp.make_future_dataframe(7)
+
+        forecast = mp.predict(future_df, mode="point", output="wide")
+
+        self.assertEqual([("y", "yhat"), ("y1", "yhat")], list(forecast.columns))
+        self.assertEqual(len(future_df), len(forecast))
+
+    def test_long_format(self):
+        long_df = pd.concat([
+            self.df.assign(series="a"),
+            self.df.assign(series="b", y=self.df["y"] * 2),
+        ]).sort_values("ds", kind="stable")
+        mp = multi_prophet.MultiProphet(columns=["a", "b"], id_column="series")
+        mp.fit(long_df)
+
+        dates = mp.make_future_dataframe(7)
+        future_df = pd.concat([dates.assign(series="b"), dates.assign(series="a")])
+        forecast = mp.predict(future_df)
+
+        self.assertEqual(["ds", "series", "yhat", "yhat_lower", "yhat_upper"],
+                         list(forecast.columns))
+        self.assertEqual(2 * len(dates), len(forecast))
+        self.assertEqual(len(self.df), len(mp.model_pool["b"].prophet.history))
+        np.testing.assert_allclose(
+            self.df["y"].values * 2,
+            mp.model_pool["b"].prophet.history["y"].values
+        )
+
+    def test_fit_schedule(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.add_seasonality(name="monthly", period=30.5, fourier_order=5, columns=["y1"])
+        report = mp.fit(self.df)
+
+        self.assertIs(mp.last_schedule, report.schedule)
+        self.assertEqual(["y1", "y"], report.schedule.order)
+        self.assertEqual(set(PREDICTOR_COLUMNS), set(report.schedule.runtimes.keys()))
+        self.assertGreater(report.schedule.makespan, 0)
+        self.assertEqual(set(PREDICTOR_COLUMNS), set(mp.cost_model.rates.keys()))
+
+    def test_instrument(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        events = mp.instrument()
+        mp.fit(self.df)
+        mp.predict(mp.make_future_dataframe(7))
+
+        summary = events.summary()
+
+        self.assertEqual([("fit", "y"), ("fit", "y1"), ("predict", "y"), ("predict", "y1")],
+                         list(summary.index))
+        self.assertTrue((summary.loc["fit", "optimize"] > 0).all())
+        self.assertTrue((summary.loc["predict", "predict"] > 0).all())
+        if forecaster.reports_iterations():
+            self.assertTrue((summary.loc["fit", "iterations"] > 0).all())
+
+    def test_prediction_cache(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+        cache = mp.cache_predictions(maxsize=10)
+
+        forecasts = mp.predict(mp.make_future_dataframe(7))
+        forecasts["y"]["yhat"] = 0.0
+        with mock.patch.object(multi_prophet, "predict_model") as predict_model:
+            cached = mp.predict(mp.make_future_dataframe(7), output="long")
+
+        predict_model.assert_not_called()
+        self.assertEqual(2, cache.info()["hits"])
+        self.assertTrue((cached["yhat"] != 0.0).all())
+
+        mp.predict(mp.make_future_dataframe(8), columns=["y"])
+        self.assertEqual(3, len(cache))
+
+        mp.add_regressor("r", columns=["y1"])
+        self.assertEqual(2, len(cache))
+        # y is reused, so its forecasts stay cached
+        mp.fit(self.df.assign(r=1.0))
+        self.assertEqual(2, len(cache))
+        mp.fit(self.df.assign(r=1.0), force=True)
+        self.assertEqual(0, len(cache))
+
+    def test_tune(self):
+        df = pd.read_csv("tests/data/retail_sales.csv")
+        df["y1"] = df["y"]
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        grid = {"changepoint_prior_scale": [0.001, 0.5]}
+        cutoffs = [pd.Timestamp("2012-01-01"), pd.Timestamp("2014-01-01")]
+
+        # without tolerance only the best candidate survives the first round
+        report = mp.tune(df, grid, "365 days", metric="mae", cutoffs=cutoffs, prune=0.0)
+
+        self.assertCountEqual(PREDICTOR_COLUMNS, report.best.keys())
+        self.assertEqual(4, len(report.results))
+        for column in PREDICTOR_COLUMNS:
+            results = report.results[report.results["column"] == column]
+            self.assertEqual([1], results[results["pruned"]]["cutoffs"].tolist())
+            self.assertEqual([2], results[~results["pruned"]]["cutoffs"].tolist())
+
+            model = mp.model_pool[column]
+            self.assertTrue(model.fitted)
+            self.assertEqual(report.best[column]["changepoint_prior_scale"],
+                             model.kwargs["changepoint_prior_scale"])
+        self.assertCountEqual(PREDICTOR_COLUMNS, report.fit_report.fitted)
+
     def test_add_seasonality_all_models(self):
         mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
         mp.add_seasonality(name="monthly", period=30.5, fourier_order=5)
@@ -185,3 +441,54 @@ class MultiProphetTestCase(unittest.TestCase):
             self.assertTrue("mape" in performance_metrics_df.columns)
             self.assertTrue("mdape" in performance_metrics_df.columns)
             self.assertTrue("coverage" in performance_metrics_df.columns)
+
+    def test_cross_validation_parallel(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+
+        cv_dfs = mp.cross_validation(horizon="365 days", period="1000 days", n_jobs=2)
+
+        self.assertEqual(PREDICTOR_COLUMNS, list(cv_dfs.keys()))
+        for cv_df in cv_dfs.values():
+            self.assertEqual(2, cv_df["cutoff"].nunique())
+            self.assertTrue(cv_df["cutoff"].is_monotonic_increasing)
+            np.testing.assert_allclose(cv_dfs["y"]["yhat"], cv_df["yhat"])
+
+    def test_cross_validation_prophet_kwargs(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+
+        cv_dfs = mp.cross_validation("365 days", period="1000 days", parallel="threads",
+                                     disable_tqdm=True, extra_output_columns="trend")
+        metrics = mp.performance_metrics("365 days", period="1000 days",
+                                         parallel="processes")
+
+        for column in PREDICTOR_COLUMNS:
+            self.assertIn("trend", cv_dfs[column].columns)
+            self.assertIn("rmse", metrics[column].columns)
+        with self.assertRaises(ValueError):
+            mp.cross_validation("365 days", period="1200 days", parallel="dask")
+
+    def test_cross_validation_cached(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+
+        cv_dfs = mp.cross_validation(horizon="365 days", period="1000 days")
+        for column, model in mp.model_pool.items():
+            pd.testing.assert_frame_equal(
+                cv_dfs[column],
+                model.cross_validation(horizon="365 days", period="1000 days")
+            )
+
+    def test_performance_metrics_cv_dfs(self):
+        mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS)
+        mp.fit(self.df)
+
+        cv_dfs = mp.cross_validation(horizon="365 days", period="1000 days")
+        performance_metrics_dfs = mp.performance_metrics(horizon="365 days",
+                                                         cv_dfs=cv_dfs,
+                                                         rolling_window=0.5)
+
+        self.assertEqual(PREDICTOR_COLUMNS, list(performance_metrics_dfs.keys()))
+        for model in mp.model_pool.values():
+            self.assertEqual(1, len(model.cv_cache))
@@ -0,0 +1,92 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest import mock
+import pandas as pd
+import multi_prophet
+from multi_prophet import data_builder, parquet, transport
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+@unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+class ParquetTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        self.df["y1"] = self.df["y"] * 2
+        self.df["cap_y"] = 500.0
+        self.df["unused"] = 1.0
+        self.builder = data_builder.DataFrameBuilder({"y": ["y1"]})
+
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.dir.name, "input.parquet")
+        self.df.to_parquet(self.path)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_parquet_frame_create_df(self):
+        data = parquet.ParquetFrame(self.path)
+        expected = transport.LocalFrame(self.df).create_df(self.builder, "y", train=True)
+
+        pd.testing.assert_frame_equal(
+            expected,
+            data.create_df(self.builder, "y", train=True)
+        )
+
+    def test_parquet_frame_pickle(self):
+        data = pickle.loads(pickle.dumps(parquet.ParquetFrame(self.path)))
+        mdf = data.create_df(self.builder, "y1")
+
+        self.assertEqual(["ds"], list(mdf.columns))
+        self.assertEqual(len(self.df), len(mdf))
+
+    def test_write_forecasts(self):
+        forecast = pd.DataFrame({
+            "ds": pd.date_range("2020-01-01", periods=3),
+            "trend": [1.0, 2.0, 3.0],
+            "yhat": [1.0, 2.0, 3.0],
+            "yhat_lower": [0.0, 1.0, 2.0],
+            "yhat_upper": [2.0, 3.0, 4.0],
+        })
+
+        columns = parquet.write_forecasts(iter([("y", forecast), ("y/1", forecast)]),
+                                          self.dir.name + "/forecasts",
+                                          components=["yhat"])
+        df = pd.read_parquet(self.dir.name + "/forecasts")
+
+        self.assertEqual(["y", "y/1"], columns)
+        self.assertEqual(["ds", "yhat", "column"], list(df.columns))
+        self.assertEqual(["y", "y/1"], sorted(df["column"].unique()))
+        self.assertEqual(6, len(df))
+
+    def test_fit_from_parquet(self):
+        mp = multi_prophet.MultiProphet(columns=["y", "y1"])
+        report = mp.fit_from_parquet(self.path, columns=["y"])
+
+        self.assertEqual(["y"], report.fitted)
+        self.assertTrue(mp.model_pool["y"].fitted)
+        self.assertFalse(mp.model_pool["y1"].fitted)
+
+        report = mp.fit(self.df.drop(columns=["unused"]))
+
+        self.assertEqual(["y"], report.reused)
+        self.assertEqual(["y1"], report.fitted)
+
+    def test_fit_from_parquet_reads_once(self):
+        mp = multi_prophet.MultiProphet(columns=["y", "y1"])
+        mp.fit_from_parquet(self.path, columns=["y"])
+        create_df = parquet.ParquetFrame.create_df
+
+        with mock.patch.object(parquet.ParquetFrame, "create_df", autospec=True,
+                               side_effect=create_df) as patched:
+            report = mp.fit_from_parquet(self.path)
+
+        self.assertEqual(2, patched.call_count)
+        self.assertEqual(["y"], report.reused)
+        self.assertEqual(["y1"], report.fitted)
+        self.assertEqual(["y"], mp.fit_from_parquet(self.path, columns=["y"]).reused)
@@ -0,0 +1,120 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+import multi_prophet
+from multi_prophet import persistence
+
+PREDICTOR_COLUMNS = ["y", "y1"]
+
+
+class PersistenceTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        cls.df["y1"] = cls.df["y"]
+        cls.df["r"] = np.cos(np.arange(len(cls.df)))
+
+        regressors = {"y1": [{"name": "r", "prior_scale": 0.5}]}
+        cls.mp = multi_prophet.MultiProphet(columns=PREDICTOR_COLUMNS,
+                                            regressors=regressors,
+                                            n_changepoints=10)
+        cls.mp.add_seasonality(name="monthly", period=30.5, fourier_order=5)
+        cls.mp.fit(cls.df)
+
+        cls.future_df = cls.mp.make_future_dataframe(7)
+        cls.future_df["r"] = 1.0
+        cls.forecasts = cls.mp.predict(cls.future_df)
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp_dir.name, "pool")
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_manifest(self):
+        self.mp.save(self.path)
+        manifest = persistence.load_manifest(self.path)
+
+        self.assertEqual(persistence.FORMAT_VERSION, manifest["format"])
+        self.assertEqual([["y1", ["r"]]], manifest["regressors"])
+        self.assertEqual(PREDICTOR_COLUMNS, [m["column"] for m in manifest["models"]])
+        self.assertEqual({"n_changepoints": 10}, manifest["models"][0]["kwargs"])
+        self.assertIsNone(manifest["id_column"])
+
+        for entry in manifest["models"]:
+            self.assertTrue(os.path.exists(os.path.join(self.path, entry["file"])))
+
+    def test_lazy_load(self):
+        self.mp.save(self.path)
+        mp = multi_prophet.MultiProphet.load(self.path)
+
+        self.assertEqual(PREDICTOR_COLUMNS, list(mp.model_pool.keys()))
+        for model in mp.model_pool.values():
+            self.assertFalse(model.loaded)
+
+        forecasts = mp.predict(self.future_df, columns=["y1"])
+
+        self.assertEqual(["y1"], list(forecasts.keys()))
+        self.assertTrue(mp.model_pool["y1"].loaded)
+        self.assertFalse(mp.model_pool["y"].loaded)
+        np.testing.assert_allclose(self.forecasts["y1"]["yhat"], forecasts["y1"]["yhat"])
+
+    def test_eager_load(self):
+        self.mp.save(self.path)
+        mp = multi_prophet.MultiProphet.load(self.path, lazy=False)
+
+        for model in mp.model_pool.values():
+            self.assertTrue(model.loaded)
+
+        forecasts = mp.predict(self.future_df)
+        for column in PREDICTOR_COLUMNS:
+            np.testing.assert_allclose(self.forecasts[column]["yhat"],
+                                       forecasts[column]["yhat"])
+
+    def test_loaded_model_state(self):
+        self.mp.save(self.path)
+        mp = multi_prophet.MultiProphet.load(self.path)
+        model = mp.model_pool["y"]
+
+        self.assertEqual({"n_changepoints": 10}, model.kwargs)
+        self.assertTrue("monthly" in model.prophet.seasonalities.keys())
+        self.assertEqual({}, model.cv_cache)
+        self.assertIsNotNone(model.prophet.stan_backend)
+
+    def test_saved_model_is_compact(self):
+        self.mp.save(self.path)
+        model = multi_prophet.MultiProphet.load(self.path).model_pool["y"].prophet
+
+        self.assertEqual(2, len(model.history))
+        self.assertIsNone(model.stan_fit)
+        self.assertEqual(len(self.df), len(self.mp.model_pool["y"].prophet.history))
+
+    def test_non_string_columns(self):
+        df = self.df[["ds", "y", "r"]].rename(columns={"y": 1})
+        df[("a", "b")] = df[1]
+        mp = multi_prophet.MultiProphet(columns=[1, ("a", "b")],
+                                        regressors={1: [{"name": "r"}]})
+        mp.fit(df)
+        mp.save(self.path)
+
+        loaded = multi_prophet.MultiProphet.load(self.path)
+        forecasts = loaded.predict(self.future_df, columns=[1])
+
+        self.assertEqual([1, ("a", "b")], list(loaded.model_pool.keys()))
+        self.assertEqual({1: ["r"]}, loaded.df_builder.regressors)
+        np.testing.assert_allclose(mp.predict(self.future_df, columns=[1])[1]["yhat"],
+                                   forecasts[1]["yhat"])
+
+    def test_save_lazy_pool(self):
+        self.mp.save(self.path)
+        mp = multi_prophet.MultiProphet.load(self.path)
+
+        other_path = os.path.join(self.tmp_dir.name, "other")
+        mp.save(other_path)
+
+        forecasts = multi_prophet.MultiProphet.load(other_path).predict(self.future_df)
+        np.testing.assert_allclose(self.forecasts["y"]["yhat"], forecasts["y"]["yhat"])
@@ -0,0 +1,72 @@
+import unittest
+import numpy as np
+import pandas as pd
+import multi_prophet
+from multi_prophet import point_forecast
+
+COLUMNS = ["y", "y1", "y2", "y3"]
+
+
+class PointForecastTestCase(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        df["y1"] = df["y"] * 2
+        df["y2"] = df["y"] + np.sin(np.arange(len(df)))
+        df["y3"] = df["y"]
+        df["r"] = np.cos(np.arange(len(df)))
+
+        config = {
+            "y": {},
+            "y1": {},
+            "y2": {"seasonality_mode": "multiplicative"},
+            "y3": {},
+        }
+        regressors = {"y3": [{"name": "r"}]}
+
+        cls.mp = multi_prophet.MultiProphet(config=config, regressors=regressors)
+        cls.mp.add_country_holidays("US", columns=["y2"])
+        cls.mp.fit(df)
+
+        future_df = cls.mp.make_future_dataframe(30)
+        future_df["r"] = np.cos(np.arange(len(future_df)))
+        cls.future_df = future_df
+
+    def test_matches_full_prediction(self):
+        full = self.mp.predict(self.future_df)
+        point = self.mp.predict(self.future_df, mode="point")
+
+        self.assertEqual(COLUMNS, list(point.keys()))
+        for column in COLUMNS:
+            self.assertEqual(["ds", "yhat"], list(point[column].columns))
+            np.testing.assert_array_equal(full[column]["ds"], point[column]["ds"])
+            np.testing.assert_allclose(full[column]["yhat"], point[column]["yhat"])
+
+    def test_feature_groups(self):
+        models = {c: m.prophet for c, m in self.mp.model_pool.items()}
+        setups = {
+            c: model.setup_dataframe(self.future_df.copy()) for c, model in models.items()
+        }
+        groups = sorted(point_forecast._feature_groups(models, setups).values())
+
+        self.assertEqual([["y", "y1"], ["y2"], ["y3"]], groups)
+
+    def test_unequal_dates(self):
+        df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        long_df = pd.concat([df.assign(series="a"), df.assign(series="b")])
+        mp = multi_prophet.MultiProphet(columns=["a", "b"], id_column="series")
+        mp.fit(long_df)
+
+        future_df = pd.concat([
+            pd.DataFrame({"ds": pd.date_range("2016-01-21", periods=7), "series": "a"}),
+            pd.DataFrame({"ds": pd.date_range("2016-03-01", periods=7), "series": "b"}),
+        ])
+        full = mp.predict(future_df)
+        point = mp.predict(future_df, mode="point")
+
+        np.testing.assert_array_equal(full["ds"], point["ds"])
+        np.testing.assert_allclose(full["yhat"], point["yhat"])
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            self.mp.predict(self.future_df, mode="invalid")
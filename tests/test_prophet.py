@@ -1,10 +1,13 @@
+import pickle
 import unittest
+from unittest import mock
 import numpy as np
 import pandas as pd
 import matplotlib
 import plotly
 import prophet
 import multi_prophet
+from multi_prophet import forecaster
 
 
 class ProphetTestCase(unittest.TestCase):
@@ -194,3 +197,115 @@ class ProphetTestCase(unittest.TestCase):
         self.assertTrue("mape" in performance_metrics_df.columns)
         self.assertTrue("mdape" in performance_metrics_df.columns)
         self.assertTrue("coverage" in performance_metrics_df.columns)
+
+    def test_cross_validation_cache(self):
+        mp = multi_prophet.Prophet()
+        mp.fit(self.df)
+
+        with mock.patch("multi_prophet.prophet.cross_validation",
+                        wraps=multi_prophet.prophet.cross_validation) as cv:
+            cv_df = mp.cross_validation(horizon="365 days", period="1000 days")
+            cached_df = mp.cross_validation(horizon="8760 hours", period="1000 days")
+
+            mp.performance_metrics(horizon="365 days", period="1000 days")
+            mp.performance_metrics(horizon="365 days",
+                                   period="1000 days",
+                                   rolling_window=0.5)
+
+        self.assertEqual(1, cv.call_count)
+        self.assertEqual(1, len(mp.cv_cache))
+        pd.testing.assert_frame_equal(cv_df, cached_df)
+
+    def test_cross_validation_cache_keys(self):
+        mp = multi_prophet.Prophet()
+        mp.fit(self.df)
+
+        mp.cross_validation(horizon="365 days", period="1000 days")
+        mp.cross_validation(horizon="365 days", period="1200 days")
+
+        self.assertEqual(2, len(mp.cv_cache))
+
+    def test_cross_validation_cache_cleared_on_new_model(self):
+        mp = multi_prophet.Prophet()
+        mp.fit(self.df)
+        mp.cross_validation(horizon="365 days", period="1000 days")
+
+        mp.prophet = prophet.Prophet()
+        self.assertEqual({}, mp.cv_cache)
+
+    def test_performance_metrics_cv_df(self):
+        mp = multi_prophet.Prophet()
+        mp.fit(self.df)
+        cv_df = mp.cross_validation(horizon="365 days", period="1000 days")
+
+        with mock.patch("multi_prophet.prophet.cross_validation") as cv:
+            performance_metrics_df = mp.performance_metrics(horizon="365 days",
+                                                            cv_df=cv_df,
+                                                            rolling_window=0.5)
+
+        cv.assert_not_called()
+        self.assertTrue("mse" in performance_metrics_df.columns)
+
+    def test_refit(self):
+        mp = multi_prophet.Prophet()
+        mp.fit(self.df)
+        first = mp.prophet
+
+        mp.fit(self.df)
+        self.assertIsNot(first, mp.prophet)
+        self.assertIsNotNone(mp.prophet.history)
+
+    def test_version(self):
+        mp = multi_prophet.Prophet()
+        versions = [mp.version]
+
+        mp.add_regressor("r")
+        versions.append(mp.version)
+        mp.fit(self.df.assign(r=0.0))
+        versions.append(mp.version)
+
+        self.assertEqual(3, len(set(versions)))
+        self.assertEqual(mp.version, pickle.loads(pickle.dumps(mp)).version)
+
+    def test_configured(self):
+        mp = multi_prophet.Prophet(changepoint_prior_scale=0.1, weekly_seasonality=False)
+        mp.add_regressor("r")
+        mp.fit(self.df.assign(r=0.0))
+
+        configured = mp.configured(changepoint_prior_scale=0.5)
+
+        self.assertFalse(configured.fitted)
+        self.assertEqual({"changepoint_prior_scale": 0.5, "weekly_seasonality": False},
+                         configured.kwargs)
+        self.assertEqual(mp.components, configured.components)
+        self.assertIn("r", configured.prophet.extra_regressors)
+
+    def test_warm_start(self):
+        mp = multi_prophet.Prophet()
+        mp.fit(self.df.head(-7))
+        self.assertIsNone(mp.iteration_delta)
+
+        mp.fit(self.df, warm_start=True)
+        self.assertTrue(mp.warm_started)
+        if forecaster.reports_iterations():
+            self.assertGreater(mp.iteration_delta, 0)
+
+    def test_warm_start_new_regressor(self):
+        mp = multi_prophet.Prophet()
+        mp.fit(self.df)
+
+        self.df["Matchday"] = 0
+        mp.add_regressor("Matchday")
+        self.assertTrue("Matchday" not in mp.prophet.extra_regressors.keys())
+
+        mp.fit(self.df, warm_start=True)
+        self.assertTrue("Matchday" in mp.prophet.extra_regressors.keys())
+
+    def test_build(self):
+        mp = multi_prophet.Prophet(growth="logistic")
+        mp.add_seasonality(name="monthly", period=30.5, fourier_order=5)
+
+        model = mp.build()
+        self.assertIsNot(mp.prophet, model)
+        self.assertEqual("logistic", model.growth)
+        self.assertTrue("monthly" in model.seasonalities.keys())
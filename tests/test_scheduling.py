@@ -0,0 +1,53 @@
+import unittest
+import multi_prophet
+from multi_prophet import scheduling
+
+
+class SchedulingTestCase(unittest.TestCase):
+    def test_estimate_cost(self):
+        model = multi_prophet.Prophet()
+        self.assertEqual(100, scheduling.estimate_cost(100, model))
+
+        model.add_seasonality(name="monthly", period=30.5, fourier_order=5)
+        model.add_country_holidays("US")
+        self.assertAlmostEqual(120, scheduling.estimate_cost(100, model))
+
+        mcmc_model = multi_prophet.Prophet(mcmc_samples=100)
+        self.assertAlmostEqual(600, scheduling.estimate_cost(100, mcmc_model))
+
+    def test_cost_model(self):
+        cost_model = scheduling.CostModel()
+        self.assertEqual(50, cost_model.estimate("y", 50))
+
+        cost_model.learn("y", 100, 2.0)
+        cost_model.learn("y1", 100, 4.0)
+
+        self.assertAlmostEqual(1.0, cost_model.estimate("y", 50))
+        self.assertAlmostEqual(2.0, cost_model.estimate("y1", 50))
+        self.assertAlmostEqual(1.5, cost_model.estimate("y2", 50))
+
+        cost_model.learn("y", 100, 4.0)
+        self.assertAlmostEqual(1.5, cost_model.estimate("y", 50))
+
+    def test_schedule_longest_first(self):
+        schedule = scheduling.Schedule({"a": 1, "b": 5, "c": 3, "d": 3}, workers=2)
+
+        self.assertEqual(["b", "c", "d", "a"], schedule.order)
+        self.assertEqual({"b": 0, "c": 1, "d": 1, "a": 0}, schedule.assignments)
+        self.assertEqual(6, schedule.estimated_makespan)
+
+    def test_schedule_makespan(self):
+        schedule = scheduling.Schedule({}, workers=4)
+
+        schedule.start()
+        schedule.finish()
+
+        self.assertEqual([], schedule.order)
+        self.assertEqual(0, schedule.estimated_makespan)
+        self.assertGreaterEqual(schedule.makespan, 0)
+
+    def test_timed(self):
+        result, seconds = scheduling.Timed(max)(1, 2)
+
+        self.assertEqual(2, result)
+        self.assertGreaterEqual(seconds, 0)
@@ -0,0 +1,103 @@
+import pickle
+import unittest
+import numpy as np
+import pandas as pd
+from multi_prophet import data_builder, transport
+
+
+class TransportTestCase(unittest.TestCase):
+    def setUp(self):
+        self.df = pd.read_csv("tests/data/example_wp_log_peyton_manning.csv")
+        self.df["y1"] = self.df["y"] * 2
+        self.df["cap_y"] = 500
+        self.builder = data_builder.DataFrameBuilder({"y": ["y1"]})
+
+    def test_local_frame(self):
+        data = transport.LocalFrame(self.df)
+
+        expected = self.builder.create_df(self.df, "y", train=True)
+        expected["ds"] = pd.to_datetime(expected["ds"])
+
+        pd.testing.assert_frame_equal(
+            expected,
+            data.create_df(self.builder, "y", train=True)
+        )
+
+    def test_shared_frame_layout(self):
+        with transport.SharedFrame(self.df, ["ds", "y", "y1", "cap_y"]) as data:
+            self.assertEqual(["ds", "y", "y1", "cap_y"], list(data.layout.keys()))
+            self.assertEqual({}, data.objects)
+
+    def test_shared_frame_create_df(self):
+        columns = self.builder.input_columns(self.df, ["y"], train=True)
+
+        with transport.SharedFrame(self.df, columns) as data:
+            worker_data = pickle.loads(pickle.dumps(data))
+            mdf = worker_data.create_df(self.builder, "y", train=True)
+
+        expected = self.builder.create_df(self.df, "y", train=True)
+        expected["ds"] = pd.to_datetime(expected["ds"])
+
+        self.assertEqual(["ds", "y", "cap", "y1"], list(mdf.columns))
+        pd.testing.assert_frame_equal(expected, mdf, check_dtype=False)
+
+    def test_shared_frame_pickles_reference_only(self):
+        columns = self.builder.input_columns(self.df, ["y"], train=True)
+
+        with transport.SharedFrame(self.df, columns) as data:
+            self.assertLess(len(pickle.dumps(data)), 1000)
+
+    def test_long_frame(self):
+        long_df = pd.DataFrame({
+            "ds": pd.date_range("2020-01-01", periods=3).repeat(2),
+            "series": ["b", "a"] * 3,
+            "y": np.arange(6.0),
+        })
+        builder = data_builder.DataFrameBuilder({}, id_column="series")
+
+        with transport.LongFrame(long_df, "series", ["ds", "y"]) as data:
+            self.assertEqual({"b": slice(0, 3), "a": slice(3, 6)}, data.rows)
+
+            series = pickle.loads(pickle.dumps(data.series("a")))
+            a_df = series.create_df(builder, "a", train=True)
+
+            with self.assertRaises(ValueError):
+                data.series("c")
+
+        np.testing.assert_array_equal([1.0, 3.0, 5.0], a_df["y"].values)
+        np.testing.assert_array_equal(long_df["ds"].unique(), a_df["ds"].values)
+
+    def test_frame_reference(self):
+        data = transport.frame_reference(self.df, ["ds", "y"])
+        self.assertIsInstance(data, transport.LocalFrame)
+
+    def test_remote_frame(self):
+        inputs = lambda column: self.builder.input_columns(self.df, [column], train=True)
+        data = transport.frame_reference(self.df, list(self.df.columns), _RemoteExecutor(),
+                                         inputs=inputs)
+        self.assertIsInstance(data, transport.RemoteFrame)
+
+        series = pickle.loads(pickle.dumps(data.series("y")))
+
+        self.assertEqual(["ds", "y", "cap_y", "y1"], list(series.df.columns))
+        pd.testing.assert_frame_equal(data.create_df(self.builder, "y", train=True),
+                                      series.create_df(self.builder, "y", train=True))
+
+    def test_remote_long_frame(self):
+        long_df = pd.DataFrame({
+            "ds": pd.date_range("2020-01-01", periods=3).repeat(2),
+            "series": ["b", "a"] * 3,
+            "y": np.arange(6.0),
+        })
+        builder = data_builder.DataFrameBuilder({}, id_column="series")
+
+        with transport.LongFrame(long_df, "series", ["ds", "y"], _RemoteExecutor()) as data:
+            series = data.series("a")
+
+        self.assertEqual(3, len(series.data.df))
+        a_df = series.create_df(builder, "a", train=True)
+        np.testing.assert_array_equal([1.0, 3.0, 5.0], a_df["y"].values)
+
+
+class _RemoteExecutor:
+    remote = True
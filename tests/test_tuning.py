@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+import pandas as pd
+import multi_prophet
+from multi_prophet import tuning
+
+
+class TuningTestCase(unittest.TestCase):
+    def test_candidates(self):
+        grid = {"changepoint_prior_scale": [0.01, 0.1], "seasonality_mode": ["additive"]}
+
+        self.assertEqual([
+            {"changepoint_prior_scale": 0.01, "seasonality_mode": "additive"},
+            {"changepoint_prior_scale": 0.1, "seasonality_mode": "additive"},
+        ], tuning.candidates(grid))
+        self.assertEqual([{"a": 1}, {"b": 2}], tuning.candidates([{"a": 1}, {"b": 2}]))
+
+    def test_scores(self):
+        errors = tuning.add_errors(None, tuning.forecast_errors([1, 2], [2, 2]))
+        errors = tuning.add_errors(errors, tuning.forecast_errors([4], [2]))
+
+        self.assertEqual(3, errors["n"])
+        self.assertAlmostEqual(5 / 3, tuning.score(errors, "mse"))
+        self.assertAlmostEqual(np.sqrt(5 / 3), tuning.score(errors, "rmse"))
+        self.assertAlmostEqual(1.0, tuning.score(errors, "mae"))
+        self.assertAlmostEqual(0.5, tuning.score(errors, "mape"))
+
+    def test_validate_metric(self):
+        tuning.validate_metric("rmse")
+        with self.assertRaises(ValueError):
+            tuning.validate_metric("r2")
+
+    def test_prune_candidates(self):
+        scores = {0: 1.0, 1: 1.4, 2: 2.0}
+
+        self.assertEqual([2], tuning.prune_candidates(scores, 0.5))
+        self.assertEqual([1, 2], tuning.prune_candidates(scores, 0.0))
+
+    def test_tuning_cutoffs(self):
+        history = pd.DataFrame({"ds": pd.date_range("2020-01-01", periods=365 * 3)})
+        model = multi_prophet.Prophet()
+
+        # initial defaults to the yearly seasonality prophet will add
+        cutoffs = tuning.tuning_cutoffs(model, history, "90 days", period="180 days")
+        self.assertGreaterEqual(cutoffs[0] - history["ds"].min(), pd.Timedelta("365 days"))
+
+        model = multi_prophet.Prophet(yearly_seasonality=False)
+        cutoffs = tuning.tuning_cutoffs(model, history, "90 days", period="180 days")
+        self.assertLess(cutoffs[0] - history["ds"].min(), pd.Timedelta("365 days"))